@@ -1,10 +1,41 @@
+import functools
 import logging
+import queue
+import re
+import sys
+import threading
 from typing import Callable
 from abc import ABC, abstractmethod
 
+from constants import CECOpcode, PowerStatus
+
+
+# Shared parameters for opcode-only frames (polls, releases, standby)
+_EMPTY_PARAMS = b''
+
+# Parameters given to a REPORT_POWER_STATUS frame that arrives without its status
+# byte, so readers can always take parameters[0]
+_MISSING_POWER_STATUS_PARAMS = bytes((PowerStatus.STANDBY,))
+
+# "XX:YY[:ZZ...]" - two hex digits per byte, at least initiator/destination and opcode
+_FRAME_RE = re.compile(r'\s*[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2})+\s*')
+
 
 class CECCommand:
-    """Represents a CEC command (received or to be transmitted)"""
+    """
+    Represents a CEC command (received or to be transmitted).
+
+    Instances are treated as immutable once constructed (apart from lazily filled
+    caches), so they can be shared between callers (see parse()).
+    """
+    __slots__ = ('command_string', 'initiator', 'destination', 'opcode', '_raw', '_parameters', '_libcec_cmd')
+
+    # Logical address we transmit from (1 = recording device)
+    SOURCE_ADDRESS = 1
+
+    # Commands created by build(), keyed by (destination, opcode, parameters)
+    _BUILD_CACHE = {}
+
     def __init__(self, command_string: str):
         """
         Create a CECCommand from a received command string.
@@ -12,24 +43,69 @@ class CECCommand:
         Args:
             command_string: Command string in format "XX:YY:ZZ..." where XX is initiator+destination
         """
-        # Store the original command string
-        self.command_string = command_string.strip()
+        # Store the original command string, interned since the daemon sees a small,
+        # highly repetitive vocabulary of frames
+        self.command_string = sys.intern(command_string.strip())
 
         # Parse the command string (format: "XX:YY:ZZ..." where XX is initiator+destination)
-        parts = self.command_string.split(':')
-        if len(parts) < 2:
+        # Validate the whole frame in one regex pass, then let bytes.fromhex decode all
+        # digits in C
+        command_string = self.command_string
+        if not _FRAME_RE.fullmatch(command_string):
             raise ValueError(f"Invalid CEC command format: {command_string}")
+        data = bytes.fromhex(command_string.replace(':', ''))
+
+        # First byte: high nibble = initiator, low nibble = destination
+        self.initiator = (data[0] >> 4) & 0xF
+        self.destination = data[0] & 0xF
+
+        # Second byte is the opcode, remaining bytes are parameters. Most frames are
+        # only examined by opcode, so parameters are sliced out on first access (and
+        # opcode-only frames share one empty value)
+        self.opcode = data[1]
+        self._raw = data
+        if len(data) > 2:
+            self._parameters = None
+        elif self.opcode == CECOpcode.REPORT_POWER_STATUS:
+            self._parameters = _MISSING_POWER_STATUS_PARAMS  # Treated as STANDBY
+        else:
+            self._parameters = _EMPTY_PARAMS
+
+        # libcec command object, built lazily by RealCECComms on first transmit
+        self._libcec_cmd = None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def parse(command_string: str) -> 'CECCommand':
+        """
+        Create a CECCommand from a received command string, memoized.
+
+        CEC traffic is highly repetitive (polls, status reports), so identical
+        frames return the same shared instance instead of being re-parsed.
+
+        Args:
+            command_string: Command string in format "XX:YY:ZZ..."
+
+        Returns:
+            CECCommand instance (shared - must not be modified)
 
-        # Parse first byte: high nibble = initiator, low nibble = destination
-        first_byte = int(parts[0], 16)
-        self.initiator = (first_byte >> 4) & 0xF
-        self.destination = first_byte & 0xF
+        Raises:
+            ValueError: If the command string is malformed
+        """
+        return CECCommand(command_string)
 
-        # Parse opcode (second byte)
-        self.opcode = int(parts[1], 16)
+    @staticmethod
+    def is_valid(command_string: str) -> bool:
+        """Return True if command_string is a well-formed "XX:YY:ZZ..." frame"""
+        return _FRAME_RE.fullmatch(command_string) is not None
 
-        # Parse parameters (remaining bytes)
-        self.parameters = bytes([int(p, 16) for p in parts[2:]]) if len(parts) > 2 else b''
+    @property
+    def parameters(self) -> bytes:
+        """Parameter bytes following the opcode (decoded on first access)"""
+        parameters = self._parameters
+        if parameters is None:
+            parameters = self._parameters = self._raw[2:]
+        return parameters
 
     @classmethod
     def build(cls, destination: int, opcode: int, parameters: bytes = b'') -> 'CECCommand':
@@ -42,25 +118,32 @@ class CECCommand:
             parameters: Optional parameter bytes
 
         Returns:
-            CECCommand instance ready for transmission
+            CECCommand instance ready for transmission (shared - must not be modified)
         """
-        # Source is always 1 (recording device)
-        source = 1
+        # The daemon sends a small, fixed set of commands, so reuse the instance
+        # (and its cached libcec command) for anything built before
+        parameters = bytes(parameters)
+        key = (destination, opcode, parameters)
+        instance = cls._BUILD_CACHE.get(key)
+        if instance is not None:
+            return instance
+
+        source = cls.SOURCE_ADDRESS
 
-        # Build command string
-        first_byte = (source << 4) | destination
-        cmd_parts = [f"{first_byte:02X}", f"{opcode:02X}"]
-        if parameters:
-            cmd_parts.extend([f"{b:02X}" for b in parameters])
-        command_string = ":".join(cmd_parts)
+        # Build command string ("XX:YY:ZZ...") in one pass over the raw frame bytes
+        frame = bytes(((source << 4) | destination, opcode)) + parameters
+        command_string = sys.intern(frame.hex(':').upper())
 
         # Create instance with all fields populated
         instance = cls.__new__(cls)
         instance.initiator = source
         instance.destination = destination
         instance.opcode = opcode
-        instance.parameters = parameters
+        instance._raw = frame
+        instance._parameters = parameters
         instance.command_string = command_string
+        instance._libcec_cmd = None
+        cls._BUILD_CACHE[key] = instance
         return instance
 
     def __str__(self):
@@ -91,8 +174,13 @@ class RealCECComms(CECComms):
         self._cec = None
         self._lib = None
         self._config = None
+        self._cec_command_cls = None
         self._on_command_callback = None
 
+        # Received frames are handed from libcec's thread to a worker thread
+        self._rx_queue = queue.SimpleQueue()
+        self._rx_thread = None
+
     def init(self, on_command: Callable[[str], int]) -> bool:
         """Initialize the CEC adapter"""
         self._on_command_callback = on_command
@@ -100,6 +188,7 @@ class RealCECComms(CECComms):
         try:
             import cec
             self._cec = cec
+            self._cec_command_cls = getattr(cec, 'cec_command', None)
 
             # Create configuration
             self._config = cec.libcec_configuration()
@@ -132,6 +221,10 @@ class RealCECComms(CECComms):
                 self.logger.error("Failed to open connection to CEC adapter")
                 return False
 
+            # Start dispatching received frames (any that arrived during Open are queued)
+            self._rx_thread = threading.Thread(target=self._rx_worker, name='CECRx', daemon=True)
+            self._rx_thread.start()
+
             self.logger.info("CEC adapter initialized successfully")
             return True
 
@@ -152,26 +245,60 @@ class RealCECComms(CECComms):
             # Get the command string from the CECCommand
             cmd_string = command.command_string
 
-            # Create command from string
-            cmd = self._lib.CommandFromString(cmd_string)
+            # Reuse the libcec command if this CECCommand has been sent before,
+            # otherwise create it and keep it for next time
+            cmd = command._libcec_cmd
+            if cmd is None:
+                cmd = self._to_libcec_command(command)
+                command._libcec_cmd = cmd
 
             # Log for debugging
-            self.logger.debug(f"TX: {cmd_string}")
+            self.logger.debug("TX: %s", cmd_string)
 
             # Transmit
             if self._lib.Transmit(cmd):
                 return True
             else:
                 # Log as debug - failure is expected when device is off/unreachable
-                self.logger.debug(f"Failed to transmit CEC command: {cmd_string}")
+                self.logger.debug("Failed to transmit CEC command: %s", cmd_string)
                 return False
 
         except Exception as e:
             self.logger.error(f"Failed to transmit CEC command: {e}")
             return False
 
+    def _to_libcec_command(self, command: CECCommand):
+        """
+        Convert a CECCommand into a libcec cec_command.
+
+        Fills the cec_command struct directly from the already-parsed fields, avoiding
+        a format-then-parse round trip through the command string. Falls back to
+        CommandFromString if the bindings don't expose the struct.
+        """
+        if self._cec_command_cls is not None:
+            try:
+                cmd = self._cec_command_cls()
+                cmd.initiator = command.initiator
+                cmd.destination = command.destination
+                cmd.opcode = command.opcode
+                cmd.opcode_set = 1
+                for b in command.parameters:
+                    cmd.parameters.PushBack(b)
+                return cmd
+            except (AttributeError, TypeError) as e:
+                self.logger.debug(f"cec_command struct not usable, falling back to CommandFromString: {e}")
+                self._cec_command_cls = None
+
+        return self._lib.CommandFromString(command.command_string)
+
     def close(self) -> None:
         """Close the CEC adapter"""
+        # Stop the RX worker first so nothing transmits while the adapter closes
+        if self._rx_thread is not None:
+            self._rx_queue.put(None)
+            self._rx_thread.join(timeout=5.0)
+            self._rx_thread = None
+
         if self._lib is not None:
             try:
                 self._lib.Close()
@@ -180,11 +307,28 @@ class RealCECComms(CECComms):
                 self.logger.error(f"Error closing CEC adapter: {e}")
 
     def _on_libcec_command(self, cmd_string: str) -> int:
-        """Internal callback from libcec - forwards to event bus"""
-        if self._on_command_callback:
-            return self._on_command_callback(cmd_string)
+        """
+        Internal callback from libcec - queues the frame for the RX worker.
+
+        Runs on libcec's own thread, so it only enqueues and returns; processors
+        (which may transmit further commands) run on the worker thread instead of
+        blocking libcec's receive loop.
+        """
+        self._rx_queue.put(cmd_string)
         return 0
 
+    def _rx_worker(self) -> None:
+        """Forward queued frames to the event bus until close() sends None"""
+        while True:
+            cmd_string = self._rx_queue.get()
+            if cmd_string is None:
+                break
+            if self._on_command_callback:
+                try:
+                    self._on_command_callback(cmd_string)
+                except Exception as e:
+                    self.logger.error(f"Error handling received CEC command '{cmd_string}': {e}")
+
 
 class MockCECComms(CECComms):
     """Mock CEC communication for testing"""
@@ -212,7 +356,7 @@ class MockCECComms(CECComms):
         cmd_string = command.command_string
 
         self.transmitted_commands.append(cmd_string)
-        self.logger.debug(f"Mock TX: {cmd_string}")
+        self.logger.debug("Mock TX: %s", cmd_string)
         return True
 
     def close(self) -> None:
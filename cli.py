@@ -7,6 +7,7 @@ Monitors CEC traffic and automatically controls TV and peripherals based on stat
 import logging
 import signal
 import sys
+import threading
 
 from cec_comms import RealCECComms
 from processor_manager import ProcessorManager
@@ -31,12 +32,13 @@ def main():
     comms = RealCECComms()
     daemon = ProcessorManager(comms)
 
-    # Setup signal handlers for graceful shutdown
+    # Setup signal handlers for graceful shutdown. The handler only records the request;
+    # the actual shutdown (which can block in libcec) happens on the main thread below
+    stop_requested = threading.Event()
+
     def signal_handler(signum, frame):
         logger.info(f"Received signal {signum}, shutting down")
-        daemon.stop()
-        logger.info("CEC Daemon stopped")
-        sys.exit(0)
+        stop_requested.set()
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -47,9 +49,12 @@ def main():
 
     logger.info("CEC Daemon running, waiting for events...")
 
-    # Block indefinitely until signal is received
+    # Block until a signal is received
     # This keeps the main thread alive while libcec callbacks run in background
-    signal.pause()
+    stop_requested.wait()
+
+    daemon.stop()
+    logger.info("CEC Daemon stopped")
 
 
 if __name__ == "__main__":
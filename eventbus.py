@@ -4,25 +4,89 @@ CEC Event Bus - Low-level CEC transmit/receive interface
 Provides an abstraction over libcec for HDMI CEC communication.
 """
 
+import heapq
+import itertools
 import logging
-from typing import Callable, Generator
+import threading
+import time
+from typing import Callable, Generator, Optional
 
 from cec_comms import CECComms, CECCommand
 
 
+class Match:
+    """
+    Filter a processor can include in a yielded command list.
+
+    The processor is then only resumed for frames with this initiator and opcode
+    (or any opcode, if none is given), instead of every frame. Processors that yield
+    no Match receive all frames.
+    """
+    __slots__ = ('key',)
+
+    def __init__(self, initiator: int, opcode: Optional[int] = None):
+        self.key = (initiator, opcode)
+
+    def __repr__(self):
+        if self.key[1] is None:
+            return f"Match(initiator={self.key[0]})"
+        return f"Match(initiator={self.key[0]}, opcode=0x{self.key[1]:02X})"
+
+
+class Sleep:
+    """
+    Timer a processor can include in a yielded command list.
+
+    If no frame resumes the processor within this many seconds, it is resumed with
+    None instead. If several are yielded together, the shortest wins.
+    """
+    __slots__ = ('seconds',)
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"Sleep({self.seconds:.3f})"
+
+
 class CECEventBus:
     """Event bus for CEC communication - manages callbacks and delegates to CECComms"""
 
     def __init__(self, comms: CECComms):
         self.logger = logging.getLogger('CECEventBus')
         self._comms = comms
-        self._callbacks = []
-        self._processors = []  # Active processor generators
+        self._callbacks = ()  # Replaced, never mutated, so RX iterates a stable snapshot
+        self._processors = {}  # Active processor generators, keyed by name
+
+        # Active processors indexed by what they are waiting for: (initiator, opcode)
+        # for those that yielded a Match (opcode None for any), otherwise the wildcard list
+        self._waiting = {}
+        self._wildcard = []
+
+        # Pending Sleep timers as a heap of (deadline, seq, name). Every yield gets a new
+        # seq, recorded in _waits (name -> (key, seq)), so entries for processors that
+        # have since been resumed or removed are recognized and skipped
+        self._timers = []
+        self._waits = {}
+        self._seq = itertools.count()
+
+        # Frames (RX thread) and timers (timer thread) both resume processors, so
+        # dispatch is serialized. Re-entrant since processors add processors
+        self._lock = threading.RLock()
+        self._timer_wakeup = threading.Condition(self._lock)
+        self._timer_thread = None
+        self._closed = False
 
     def init(self) -> bool:
         """Initialize the CEC communication layer"""
         return self._comms.init(self._on_cec_command_internal)
 
+    def start_timers(self) -> None:
+        """Start the thread that resumes processors whose Sleep has expired"""
+        if self._timer_thread is None:
+            self._timer_thread = threading.Thread(target=self._timer_worker, name='CECTimer', daemon=True)
+            self._timer_thread.start()
+
     def transmit(self, destination: int, opcode: int, params: bytes = b'') -> bool:
         """Transmit a CEC command via the comms layer"""
         command = CECCommand.build(destination, opcode, params)
@@ -30,64 +94,186 @@ class CECEventBus:
 
     def add_callback(self, handler: Callable[[CECCommand], None]) -> None:
         """Register a callback for received CEC commands"""
-        self._callbacks.append(handler)
+        self._callbacks = self._callbacks + (handler,)
 
     def add_processor(self, processor: Generator) -> None:
         """
         Add a processor generator.
 
         The processor should yield lists of CECCommands to transmit, and receives
-        CECCommands via send(). Include None in the command list to terminate.
+        CECCommands via send(). Include None in the command list to terminate, a
+        Match to only be resumed for frames with that initiator (and opcode), or a
+        Sleep to be resumed with None if nothing else resumes it in time.
 
         Args:
             processor: Generator that yields lists of CECCommands and receives CECCommands
         """
-        # Check if a processor with this name already exists
-        processor_name = processor.__name__
-        for existing in self._processors:
-            if existing.__name__ == processor_name:
+        with self._lock:
+            # Check if a processor with this name already exists
+            processor_name = processor.__name__
+            if processor_name in self._processors:
                 self.logger.debug(f"Processor '{processor_name}' already active, not adding duplicate")
                 return
 
-        try:
-            # Start the processor and get the first list of commands to transmit
-            first_commands = next(processor)
-
-            # Transmit all initial commands, check for None termination signal
-            processor_done = False
-            for cmd in first_commands:
-                if cmd is None:
-                    # Processor signaled termination
-                    processor_done = True
-                    break
-                self._comms.transmit(cmd)
-                self.logger.debug(f"Processor '{processor.__name__}' sent initial command: {cmd}")
-
-            if processor_done:
-                self.logger.debug(f"Processor '{processor.__name__}' completed immediately (None in command list)")
-                return
+            try:
+                # Start the processor and get the first list of commands to transmit
+                first_commands = next(processor)
+
+                # Transmit all initial commands, check for None termination signal
+                if not self._handle_yield(processor, first_commands, self._comms.transmit):
+                    self.logger.debug(f"Processor '{processor.__name__}' completed immediately (None in command list)")
+                    return
+
+                # Add to active processors list
+                self._processors[processor_name] = processor
+                self.logger.debug(f"Added processor '{processor.__name__}' (total: {len(self._processors)})")
+
+            except StopIteration:
+                # Processor completed immediately
+                self.logger.debug(f"Processor '{processor.__name__}' completed immediately (StopIteration)")
+            except Exception as e:
+                self.logger.error(f"Error starting processor '{processor.__name__}': {e}")
+
+    def has_processor(self, name: str) -> bool:
+        """Return True if a processor with this name is active"""
+        return name in self._processors
+
+    def _handle_yield(self, processor: Generator, commands, transmit) -> bool:
+        """
+        Transmit the commands a processor yielded and file it under what it waits for.
+
+        Returns:
+            False if the processor signaled termination (None in command list)
+        """
+        match = None
+        sleep = None
+        for cmd in commands:
+            if cmd is None:
+                return False
+            cls = cmd.__class__
+            if cls is Match:
+                match = cmd
+                continue
+            if cls is Sleep:
+                if sleep is None or cmd.seconds < sleep:
+                    sleep = cmd.seconds
+                continue
+            transmit(cmd)
+            self.logger.debug("Processor '%s' sent command: %s", processor.__name__, cmd)
+
+        seq = next(self._seq)
+        if match is None:
+            key = None
+            self._wildcard.append(processor)
+        else:
+            key = match.key
+            self._waiting.setdefault(key, []).append(processor)
+        self._waits[processor.__name__] = (key, seq)
+
+        if sleep is not None:
+            deadline = time.monotonic() + sleep
+            # The timer thread only needs waking if this is now the earliest deadline
+            if not self._timers or deadline < self._timers[0][0]:
+                self._timer_wakeup.notify()
+            heapq.heappush(self._timers, (deadline, seq, processor.__name__))
+        return True
+
+    def _resume(self, processor: Generator, event, transmit, debug: bool) -> bool:
+        """
+        Send an event (a CECCommand, or None for an expired Sleep) to a processor.
 
-            # Add to active processors list
-            self._processors.append(processor)
-            self.logger.debug(f"Added processor '{processor.__name__}' (total: {len(self._processors)})")
+        Returns:
+            True if the processor finished and should be removed
+        """
+        try:
+            # Processor yielded a list of commands - transmit them all
+            # Check for None in the list which signals termination
+            if not self._handle_yield(processor, processor.send(event), transmit):
+                if debug:
+                    self.logger.debug("Processor '%s' signaled termination (None in command list)", processor.__name__)
+                return True
+            return False
 
         except StopIteration:
-            # Processor completed immediately
-            self.logger.debug(f"Processor '{processor.__name__}' completed immediately (StopIteration)")
+            # Processor finished via return
+            if debug:
+                self.logger.debug("Processor '%s' completed (StopIteration)", processor.__name__)
+            return True
         except Exception as e:
-            self.logger.error(f"Error starting processor '{processor.__name__}': {e}")
+            self.logger.error(f"Error in processor '{processor.__name__}': {e}")
+            return True
+
+    def _remove_finished(self, finished_processors, debug: bool) -> None:
+        """Forget processors that have finished"""
+        for processor in finished_processors:
+            del self._processors[processor.__name__]
+            self._waits.pop(processor.__name__, None)
+
+        if debug:
+            finished_names = [p.__name__ for p in finished_processors]
+            self.logger.debug("Removed %d processor(s) %s, %d remaining", len(finished_processors), finished_names, len(self._processors))
+
+    def tick(self) -> None:
+        """Resume every processor whose Sleep has expired with None"""
+        with self._lock:
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            transmit = self._comms.transmit
+            timers = self._timers
+            now = time.monotonic()
+            finished_processors = []
+            while timers and timers[0][0] <= now:
+                _, seq, name = heapq.heappop(timers)
+                wait = self._waits.get(name)
+                if wait is None or wait[1] != seq:
+                    continue  # Resumed or removed since this timer was set
+
+                # Take it out of the frame index first, just as frame dispatch does
+                key = wait[0]
+                processor = self._processors[name]
+                if key is None:
+                    self._wildcard.remove(processor)
+                else:
+                    self._waiting[key].remove(processor)
+                    if not self._waiting[key]:
+                        del self._waiting[key]
+
+                if self._resume(processor, None, transmit, debug):
+                    finished_processors.append(processor)
+
+            if finished_processors:
+                self._remove_finished(finished_processors, debug)
+
+    def _timer_worker(self) -> None:
+        """Wait for the earliest pending timer and run tick() until close()"""
+        with self._timer_wakeup:
+            while not self._closed:
+                try:
+                    self.tick()
+                except Exception as e:
+                    self.logger.error(f"Error running processor timers: {e}")
+                timeout = self._timers[0][0] - time.monotonic() if self._timers else None
+                self._timer_wakeup.wait(timeout)
 
     def _on_cec_command_internal(self, cmd_string: str) -> int:
         """Internal callback from comms layer"""
+        # Checked once per frame rather than by every debug call below
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
         try:
             # Strip the ">>" prefix if present
             # @todo Does this ever happen? I suspect not
-            if cmd_string and cmd_string.startswith(">>"):
-                cmd_string = cmd_string.strip().lstrip(">").strip()
+            if cmd_string.startswith(">>"):
+                cmd_string = cmd_string[2:].strip()
 
-            cec_cmd = CECCommand(cmd_string)
+            # Reject malformed frames up front rather than raising out of the parser
+            if not CECCommand.is_valid(cmd_string):
+                self.logger.warning("Invalid CEC command: %s", cmd_string)
+                return 0
 
-            self.logger.debug(f"RX: {cec_cmd}")
+            cec_cmd = CECCommand.parse(cmd_string)
+
+            if debug:
+                self.logger.debug("RX: %s", cec_cmd)
 
             # Dispatch to all registered callbacks
             for handler in self._callbacks:
@@ -96,38 +282,37 @@ class CECEventBus:
                 except Exception as e:
                     self.logger.error(f"Error in CEC callback handler: {e}")
 
-            # Dispatch to all active processors
-            finished_processors = []
-            for processor in self._processors:
-                try:
-                    # Send the command to the processor
-                    commands = processor.send(cec_cmd)
-
-                    # Processor yielded a list of commands - transmit them all
-                    # Check for None in the list which signals termination
-                    for cmd in commands:
-                        if cmd is None:
-                            self.logger.debug(f"Processor '{processor.__name__}' signaled termination (None in command list)")
-                            finished_processors.append(processor)
-                            break
-                        self._comms.transmit(cmd)
-                        self.logger.debug(f"Processor '{processor.__name__}' sent command: {cmd}")
-
-                except StopIteration:
-                    # Processor finished via return
-                    self.logger.debug(f"Processor '{processor.__name__}' completed (StopIteration)")
-                    finished_processors.append(processor)
-                except Exception as e:
-                    self.logger.error(f"Error in processor '{processor.__name__}': {e}")
-                    finished_processors.append(processor)
+            # Our own frames echoed back can never be a response a processor is
+            # waiting for, so don't wake the processors for them
+            if cec_cmd.initiator == CECCommand.SOURCE_ADDRESS:
+                return 0
 
-            # Remove finished processors
-            for processor in finished_processors:
-                self._processors.remove(processor)
+            with self._lock:
+                # Dispatch to the processors waiting for this frame or anything from its
+                # initiator, plus those taking every frame. Each is taken out of the index
+                # here and re-filed by _handle_yield under whatever it yields next
+                targets = self._wildcard
+                self._wildcard = []
+                waiting = self._waiting
+                if waiting:
+                    matched = waiting.pop((cec_cmd.initiator, cec_cmd.opcode), None)
+                    if matched:
+                        targets += matched
+                    matched = waiting.pop((cec_cmd.initiator, None), None)
+                    if matched:
+                        targets += matched
 
-            if finished_processors:
-                finished_names = [p.__name__ for p in finished_processors]
-                self.logger.debug(f"Removed {len(finished_processors)} processor(s) {finished_names}, {len(self._processors)} remaining")
+                resume = self._resume
+                transmit = self._comms.transmit
+                finished_processors = []
+                for processor in targets:
+                    # Send the command to the processor
+                    if resume(processor, cec_cmd, transmit, debug):
+                        finished_processors.append(processor)
+
+                # Remove finished processors
+                if finished_processors:
+                    self._remove_finished(finished_processors, debug)
 
             return 0  # Callback should return 0
 
@@ -140,4 +325,12 @@ class CECEventBus:
 
     def close(self) -> None:
         """Close the CEC communication layer"""
+        # Stop the timer thread first so no processor runs while the adapter closes
+        if self._timer_thread is not None:
+            with self._timer_wakeup:
+                self._closed = True
+                self._timer_wakeup.notify()
+            self._timer_thread.join(timeout=5.0)
+            self._timer_thread = None
+
         self._comms.close()
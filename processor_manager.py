@@ -2,7 +2,7 @@ import logging
 
 from cec_comms import CECComms
 from eventbus import CECEventBus
-from processors import Addresses, SwitchStatusProcessor, SoundbarOnWithTvProcessor
+from processors import Addresses, PowerStatusCache, SwitchStatusProcessor, SoundbarOnWithTvProcessor
 
 
 class ProcessorManager:
@@ -24,6 +24,10 @@ class ProcessorManager:
         self.eventbus = CECEventBus(comms)
         self.addresses = Addresses()
 
+        # Shared by processors so they can skip polls for recently reported status
+        self.power_cache = PowerStatusCache()
+        self.eventbus.add_callback(self.power_cache.observe)
+
     def start(self):
         """Initialize the event bus and start all processors"""
         self.logger.info("Starting processor manager")
@@ -33,12 +37,15 @@ class ProcessorManager:
             self.logger.error("Failed to initialize event bus")
             return False
 
+        # Resume processors whose poll intervals and timeouts expire between frames
+        self.eventbus.start_timers()
+
         # Add long-running processors
         self.logger.info("Adding SwitchStatusProcessor")
-        self.eventbus.add_processor(SwitchStatusProcessor(self.eventbus, self.addresses))
+        self.eventbus.add_processor(SwitchStatusProcessor(self.eventbus, self.addresses, self.power_cache))
 
         self.logger.info("Adding SoundbarOnWithTvProcessor")
-        self.eventbus.add_processor(SoundbarOnWithTvProcessor(self.eventbus, self.addresses))
+        self.eventbus.add_processor(SoundbarOnWithTvProcessor(self.eventbus, self.addresses, self.power_cache))
 
         self.logger.info("Processor manager started")
         return True
@@ -1,13 +1,22 @@
 import logging
 import time
+from collections import deque
+from typing import Optional
 
 from cec_comms import CECCommand
+from eventbus import Match, Sleep
 from with_timeout import with_timeout
 from constants import PowerStatus, CECOpcode, UserControlCode
 
 
+# Shared command list for processors that terminate without sending anything
+_TERMINATE = (None,)
+
+
 class Addresses:
     """CEC device addresses used by processors"""
+    __slots__ = ('tv', 'pi', 'switch', 'soundbar', 'chromecast', 'broadcast', 'chromecast_physical')
+
     def __init__(self):
         # Logical addresses
         self.tv = 0
@@ -23,8 +32,38 @@ class Addresses:
         self.chromecast_physical = b'\x30\x00'  # HDMI 3 physical address
 
 
+class PowerStatusCache:
+    """
+    Most recent power status reported by each device.
+
+    observe() is registered as an event bus callback, so every REPORT_POWER_STATUS on
+    the bus is recorded - including replies to other processors' polls - and
+    processors can skip a poll when a recent answer is already known.
+    """
+    TTL = 3.0  # Seconds a reported status is trusted for by default
+
+    def __init__(self):
+        self._entries = {}  # Logical address -> (status, monotonic time reported)
+
+    def observe(self, cmd: CECCommand) -> None:
+        """Record the status from a REPORT_POWER_STATUS frame"""
+        if cmd.opcode == CECOpcode.REPORT_POWER_STATUS:
+            self._entries[cmd.initiator] = (cmd.parameters[0], time.monotonic())
+
+    def get(self, address: int, max_age: float = TTL) -> Optional[int]:
+        """Return the device's last reported status if no older than max_age, else None"""
+        entry = self._entries.get(address)
+        if entry is not None and time.monotonic() - entry[1] <= max_age:
+            return entry[0]
+        return None
+
+    def invalidate(self, address: int) -> None:
+        """Forget the device's status (e.g. after we toggle its power)"""
+        self._entries.pop(address, None)
+
+
 @with_timeout(5.0)
-def TurnSoundbarOnProcessor(addresses):
+def TurnSoundbarOnProcessor(addresses, power_cache: Optional[PowerStatusCache] = None):
     """
     Processor that turns on the soundbar if it's off.
 
@@ -32,23 +71,30 @@ def TurnSoundbarOnProcessor(addresses):
 
     Args:
         addresses: Addresses instance containing CEC device addresses
+        power_cache: Optional PowerStatusCache - skips the status poll if the soundbar
+            recently reported ON
     """
     logger = logging.getLogger('TurnSoundbarOnProcessor')
 
-    # Check soundbar status
-    logger.debug("Checking soundbar power status")
-    cmd = yield [CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)]
+    if power_cache is not None and power_cache.get(addresses.soundbar) == PowerStatus.ON:
+        logger.debug("Soundbar recently reported ON, nothing to do")
+        return
 
-    # Wait for soundbar power status response
-    while cmd.initiator != addresses.soundbar or cmd.opcode != CECOpcode.REPORT_POWER_STATUS:
-        cmd = yield []
+    # Check soundbar status, resuming only for the soundbar's power status response
+    logger.debug("Checking soundbar power status")
+    cmd = yield [
+        CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS),
+        Match(addresses.soundbar, CECOpcode.REPORT_POWER_STATUS)
+    ]
 
-    soundbar_status = cmd.parameters[0] if cmd.parameters else PowerStatus.STANDBY
-    logger.debug(f"Soundbar status: 0x{soundbar_status:02X} ({'ON' if soundbar_status == PowerStatus.ON else 'STANDBY'})")
+    soundbar_status = cmd.parameters[0]
+    logger.debug("Soundbar status: 0x%02X (%s)", soundbar_status, 'ON' if soundbar_status == PowerStatus.ON else 'STANDBY')
 
     # If soundbar is off, turn it on
     if soundbar_status == PowerStatus.STANDBY:
         logger.info("Soundbar is off, sending power toggle")
+        if power_cache is not None:
+            power_cache.invalidate(addresses.soundbar)
         yield [
             CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.USER_CONTROL_PRESSED, parameters=bytes([UserControlCode.POWER])),
             CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.USER_CONTROL_RELEASE),
@@ -74,83 +120,86 @@ def SetSoundbarVolumeProcessor(addresses, target_volume: int):
 
     VOLUME_STEP = 2  # Each volume up/down command changes volume by 2
 
-    # Check soundbar power status
+    # Check soundbar power status, resuming only for the soundbar's response
     logger.debug("Checking soundbar power status")
-    cmd = yield [CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)]
+    cmd = yield [
+        CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS),
+        Match(addresses.soundbar, CECOpcode.REPORT_POWER_STATUS)
+    ]
 
-    # Wait for soundbar power status response
-    while cmd.initiator != addresses.soundbar or cmd.opcode != CECOpcode.REPORT_POWER_STATUS:
-        cmd = yield []
-
-    soundbar_status = cmd.parameters[0] if cmd.parameters else PowerStatus.STANDBY
-    logger.debug(f"Soundbar status: 0x{soundbar_status:02X}")
+    soundbar_status = cmd.parameters[0]
+    logger.debug("Soundbar status: 0x%02X", soundbar_status)
 
     # If soundbar is off, don't set volume
     if soundbar_status != PowerStatus.ON:
         logger.info("Soundbar is off, not setting volume")
-        yield [None]
+        yield _TERMINATE
         return
 
-    # Get current volume
+    # Get current volume, resuming only for the soundbar's audio status response
     logger.debug("Getting current soundbar volume")
-    cmd = yield [CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.GIVE_AUDIO_STATUS)]
-
-    # Wait for audio status response
-    while cmd.initiator != addresses.soundbar or cmd.opcode != CECOpcode.REPORT_AUDIO_STATUS:
-        cmd = yield []
+    cmd = yield [
+        CECCommand.build(destination=addresses.soundbar, opcode=CECOpcode.GIVE_AUDIO_STATUS),
+        Match(addresses.soundbar, CECOpcode.REPORT_AUDIO_STATUS)
+    ]
 
     # Volume is in the first parameter byte
     current_volume = cmd.parameters[0] if cmd.parameters else 0
-    logger.debug(f"Current volume: {current_volume} (0x{current_volume:02X})")
+    logger.debug("Current volume: %d (0x%02X)", current_volume, current_volume)
 
     # Check if already at target
     if current_volume == target_volume:
-        logger.info(f"Volume already at target: {target_volume} (0x{target_volume:02X})")
-        yield [None]
+        logger.info("Volume already at target: %d (0x%02X)", target_volume, target_volume)
+        yield _TERMINATE
         return
 
     # Calculate number of steps needed (ceiling division)
     diff = target_volume - current_volume
     steps = (abs(diff) + VOLUME_STEP - 1) // VOLUME_STEP
 
-    # Build volume commands (sent to TV, not soundbar)
-    commands = []
+    # Build volume commands (sent to TV, not soundbar). Commands are immutable, so each
+    # step repeats the same press/release pair
     if diff > 0:
-        logger.info(f"Increasing volume from {current_volume} to {target_volume} ({steps} steps)")
-        for _ in range(steps):
-            commands.append(CECCommand.build(destination=addresses.tv, opcode=CECOpcode.USER_CONTROL_PRESSED, parameters=bytes([UserControlCode.VOLUME_UP])))
-            commands.append(CECCommand.build(destination=addresses.tv, opcode=CECOpcode.USER_CONTROL_RELEASE))
+        logger.info("Increasing volume from %d to %d (%d steps)", current_volume, target_volume, steps)
+        key = UserControlCode.VOLUME_UP
     else:
-        logger.info(f"Decreasing volume from {current_volume} to {target_volume} ({steps} steps)")
-        for _ in range(steps):
-            commands.append(CECCommand.build(destination=addresses.tv, opcode=CECOpcode.USER_CONTROL_PRESSED, parameters=bytes([UserControlCode.VOLUME_DOWN])))
-            commands.append(CECCommand.build(destination=addresses.tv, opcode=CECOpcode.USER_CONTROL_RELEASE))
+        logger.info("Decreasing volume from %d to %d (%d steps)", current_volume, target_volume, steps)
+        key = UserControlCode.VOLUME_DOWN
+    press = CECCommand.build(destination=addresses.tv, opcode=CECOpcode.USER_CONTROL_PRESSED, parameters=bytes((key,)))
+    release = CECCommand.build(destination=addresses.tv, opcode=CECOpcode.USER_CONTROL_RELEASE)
 
     # Send all volume commands and terminate
-    commands.append(None)
-    yield commands
+    yield [press, release] * steps + [None]
 
 
-def SoundbarOnWithTvProcessor(eventbus, addresses):
+def SoundbarOnWithTvProcessor(eventbus, addresses, power_cache: Optional[PowerStatusCache] = None):
     """
     Processor that monitors TV status and ensures soundbar is on when TV is on.
 
     Steps:
     1. Initially check if TV is on
     2. Poll every 500ms to detect TV state changes
-    3. When TV is ON: spawn TurnSoundbarOnProcessor to ensure soundbar is on
+    3. When TV is ON: spawn TurnSoundbarOnProcessor to ensure soundbar is on, unless
+       power_cache has seen the soundbar report ON within the last 30 seconds
 
     Args:
         eventbus: Reference to CECEventBus for spawning processors
         addresses: Addresses instance containing CEC device addresses
+        power_cache: Optional PowerStatusCache, consulted before spawning and passed on
     """
     logger = logging.getLogger('SoundbarOnWithTvProcessor')
 
     # Timing constants
     POLL_INTERVAL = 0.5  # Poll every 500ms
     POLL_TIMEOUT = 2.0   # Wait 2 seconds for poll response
+    SOUNDBAR_ON_MAX_AGE = 30.0  # Trust a soundbar ON report this long before re-checking
+
+    # Looked up once rather than on every frame
+    tv = addresses.tv
+    soundbar = addresses.soundbar
+    poll_tv = CECCommand.build(destination=tv, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)
 
-    # State tracking
+    # State tracking (monotonic clock, so wall-clock adjustments can't fake a timeout)
     tv_is_on = False
     last_poll_time = 0
     waiting_for_poll_response = False
@@ -158,13 +207,13 @@ def SoundbarOnWithTvProcessor(eventbus, addresses):
 
     # Step 1: Initial status check
     logger.info("Checking initial TV status")
-    cmd = yield [CECCommand.build(destination=addresses.tv, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)]
     waiting_for_poll_response = True
-    poll_start_time = time.time()
+    poll_start_time = last_poll_time = time.monotonic()
+    cmd = yield [poll_tv, Sleep(POLL_TIMEOUT)]
 
     # Main event loop - runs indefinitely
     while True:
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Check for timeout on poll response
         if waiting_for_poll_response and (current_time - poll_start_time) >= POLL_TIMEOUT:
@@ -175,21 +224,25 @@ def SoundbarOnWithTvProcessor(eventbus, addresses):
                 logger.info("TV turned off (poll timeout)")
                 tv_is_on = False
 
-        # Process incoming command
-        if cmd.initiator == addresses.tv:
+        # Process incoming command (None when resumed by a Sleep expiring)
+        if cmd is not None and cmd.initiator == tv:
             # Check for power status response
             if cmd.opcode == CECOpcode.REPORT_POWER_STATUS:
                 if waiting_for_poll_response:
                     waiting_for_poll_response = False
                     last_poll_time = current_time
-                    status = cmd.parameters[0] if cmd.parameters else PowerStatus.STANDBY
+                    status = cmd.parameters[0]
 
                     if status == PowerStatus.ON:
                         if not tv_is_on:
                             logger.info("TV is ON")
                             tv_is_on = True
-                        # Spawn TurnSoundbarOnProcessor when TV is on
-                        eventbus.add_processor(TurnSoundbarOnProcessor(addresses))
+                        # Spawn TurnSoundbarOnProcessor when TV is on, unless the soundbar
+                        # was recently seen ON (saves a soundbar poll on every TV poll) or
+                        # one is still in flight (add_processor would only discard it)
+                        soundbar_known_on = power_cache is not None and power_cache.get(soundbar, SOUNDBAR_ON_MAX_AGE) == PowerStatus.ON
+                        if not soundbar_known_on and not eventbus.has_processor('TurnSoundbarOnProcessor'):
+                            eventbus.add_processor(TurnSoundbarOnProcessor(addresses, power_cache))
                     else:
                         # TV reported non-ON status
                         if tv_is_on:
@@ -200,133 +253,238 @@ def SoundbarOnWithTvProcessor(eventbus, addresses):
         if not waiting_for_poll_response:
             if (current_time - last_poll_time) >= POLL_INTERVAL:
                 logger.debug("Polling TV status")
-                cmd = yield [CECCommand.build(destination=addresses.tv, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)]
+                cmd = yield [poll_tv, Sleep(POLL_TIMEOUT)]
                 last_poll_time = current_time
                 waiting_for_poll_response = True
                 poll_start_time = current_time
                 continue
 
-        # Wait for next event
-        cmd = yield []
+        # Wait for next event, or until the poll response times out / the next poll is due
+        if waiting_for_poll_response:
+            cmd = yield [Sleep(poll_start_time + POLL_TIMEOUT - current_time)]
+        else:
+            cmd = yield [Sleep(last_poll_time + POLL_INTERVAL - current_time)]
 
 
-def SwitchStatusProcessor(eventbus, addresses):
+def SwitchStatusProcessor(eventbus, addresses, power_cache: Optional[PowerStatusCache] = None):
     """
     Processor that monitors Switch status and switches to Chromecast when Switch turns off.
 
     Steps:
     1. Initially check if Switch is on
     2. While Switch is on: poll every 5 seconds to detect when it turns off
-    3. While Switch is off: poll every 60 seconds and watch for ACTIVE_SOURCE to detect when it turns on
-    4. When Switch turns off: switch active source to Chromecast
+    3. While Switch is off: watch for ACTIVE_SOURCE to detect when it turns on, and poll in
+       case it doesn't announce itself - every 2 seconds at first, backing off to every 2 minutes
+    4. When Switch turns off (poll timeouts, status report, or a STANDBY confirmed by the
+       next poll): switch active source to Chromecast
 
     Args:
         eventbus: Reference to CECEventBus for spawning processors
         addresses: Addresses instance containing CEC device addresses
+        power_cache: Optional PowerStatusCache, passed on to spawned processors
     """
     logger = logging.getLogger('SwitchStatusProcessor')
 
     # Timing constants
-    POLL_INTERVAL_ON = 5.0   # Poll every 5 seconds when Switch is on
-    POLL_INTERVAL_OFF = 60.0  # Poll every 60 seconds when Switch is off
-    POLL_TIMEOUT = 2.0        # Wait 2 seconds for poll response
-
-    # State tracking
+    POLL_INTERVAL_ON = 5.0   # Poll at least every 5 seconds when Switch is on
+    POLL_INTERVAL_OFF_MIN = 2.0    # Poll 2 seconds after the Switch turns off...
+    POLL_INTERVAL_OFF_MAX = 120.0  # ...backing off to every 2 minutes while it stays off
+    POLL_BACKOFF_FACTOR = 1.5
+    POLL_TIMEOUT = 2.0        # Wait 2 seconds for a poll response until response times are known
+    MIN_POLL_TIMEOUT = 0.5    # ...then at least 500ms, however quickly the Switch has been answering
+    MAX_POLL_TIMEOUT = 10.0   # ...and at most 10 seconds, however slow the bus has been
+
+    # Looked up once rather than on every frame
+    switch = addresses.switch
+    from_switch = Match(switch)  # Only frames from the Switch matter, the rest is timers
+    poll_switch = CECCommand.build(destination=switch, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)
+    select_chromecast = CECCommand.build(
+        destination=addresses.broadcast,
+        opcode=CECOpcode.SET_STREAM_PATH,
+        parameters=addresses.chromecast_physical
+    )
+
+    # State tracking (monotonic clock, so wall-clock adjustments can't fake a timeout)
     switch_is_on = False
     last_poll_time = 0
     waiting_for_poll_response = False
     poll_start_time = 0
     consecutive_timeouts = 0  # Track consecutive poll timeouts
+    poll_timed_out = False    # Last poll timed out, but its reply may still turn up late
+    standby_announced = False  # Switch sent STANDBY, switch once a poll confirms it's off
+
+    # Poll timing adapted to the Switch's recent response times: timeout at twice the
+    # average round-trip, and back off the on-interval if the bus is slow. Late replies
+    # are sampled too, so the timeout grows again when the bus gets busier
+    response_times = deque(maxlen=8)
+    poll_timeout = POLL_TIMEOUT
+    poll_interval_on = POLL_INTERVAL_ON
+
+    # While off, polls start frequent (the Switch is most likely to come back soon after
+    # it went off, or when it shows signs of life) and back off while it stays off
+    poll_interval_off = POLL_INTERVAL_OFF_MIN
+
+    # Timeout for the poll in flight, never more than half the interval it was sent at
+    pending_poll_timeout = POLL_TIMEOUT
 
     # Step 1: Initial status check
     logger.info("Checking initial Switch status")
-    cmd = yield [CECCommand.build(destination=addresses.switch, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)]
     waiting_for_poll_response = True
-    poll_start_time = time.time()
+    poll_start_time = last_poll_time = time.monotonic()
+    cmd = yield [poll_switch, from_switch, Sleep(POLL_TIMEOUT)]
 
     # Main event loop - runs indefinitely
     while True:
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Check for timeout on poll response
-        if waiting_for_poll_response and (current_time - poll_start_time) >= POLL_TIMEOUT:
+        if waiting_for_poll_response and (current_time - poll_start_time) >= pending_poll_timeout:
             logger.debug("Switch poll timeout - no response")
             waiting_for_poll_response = False
+            poll_timed_out = True
 
-            if switch_is_on:
+            if not switch_is_on:
+                # Still off - the next (backed off) interval runs from now
+                last_poll_time = current_time
+                if standby_announced:
+                    logger.info("Switch standby confirmed (poll timeout)")
+                    standby_announced = False
+                    logger.info("Switching active source to Chromecast")
+                    cmd = yield [select_chromecast, from_switch, Sleep(poll_interval_off)]
+                    continue
+            else:
                 consecutive_timeouts += 1
-                logger.debug(f"Consecutive timeouts: {consecutive_timeouts}")
+                logger.debug("Consecutive timeouts: %d", consecutive_timeouts)
 
                 if consecutive_timeouts >= 3:
                     # Switch was on but now not responding for 3 consecutive polls - it turned off
                     logger.info("Switch turned off (3 consecutive poll timeouts)")
                     switch_is_on = False
                     consecutive_timeouts = 0  # Reset for next time
+                    last_poll_time = current_time
+                    poll_interval_off = POLL_INTERVAL_OFF_MIN
                     logger.info("Switching active source to Chromecast")
-                    cmd = yield [CECCommand.build(
-                        destination=addresses.broadcast,
-                        opcode=CECOpcode.SET_STREAM_PATH,
-                        parameters=addresses.chromecast_physical
-                    )]
+                    cmd = yield [select_chromecast, from_switch, Sleep(poll_interval_off)]
                     continue
 
-        # Process incoming command
-        if cmd.initiator == addresses.switch:
+        # Process incoming command (None when resumed by a Sleep expiring). Anything
+        # else is from the Switch, since that's all from_switch lets through
+        if cmd is not None:
             # Check for ACTIVE_SOURCE broadcast (Switch turned on)
             if cmd.opcode == CECOpcode.ACTIVE_SOURCE:
                 if not switch_is_on:
                     logger.info("Switch turned on (ACTIVE_SOURCE detected)")
                     switch_is_on = True
+                    standby_announced = False
                     last_poll_time = current_time
                     waiting_for_poll_response = False
                     consecutive_timeouts = 0  # Reset timeout counter
                     # Spawn TurnSoundbarOnProcessor
                     logger.info("Spawning TurnSoundbarOnProcessor")
-                    eventbus.add_processor(TurnSoundbarOnProcessor(addresses))
+                    eventbus.add_processor(TurnSoundbarOnProcessor(addresses, power_cache))
 
             # Check for power status response
+            # A reply to us after the poll timed out is still a reply: the Switch is there,
+            # just slow, so it cancels that timeout and its round-trip is sampled
             elif cmd.opcode == CECOpcode.REPORT_POWER_STATUS:
-                if waiting_for_poll_response:
+                if waiting_for_poll_response or (poll_timed_out and cmd.destination == CECCommand.SOURCE_ADDRESS):
+                    if not waiting_for_poll_response:
+                        logger.debug("Late Switch poll response after %.2fs", current_time - poll_start_time)
                     waiting_for_poll_response = False
+                    poll_timed_out = False
                     consecutive_timeouts = 0  # Reset timeout counter on any response
-                    status = cmd.parameters[0] if cmd.parameters else PowerStatus.STANDBY
+
+                    response_times.append(current_time - poll_start_time)
+                    average_response_time = sum(response_times) / len(response_times)
+                    poll_timeout = min(MAX_POLL_TIMEOUT, max(MIN_POLL_TIMEOUT, 2 * average_response_time))
+                    poll_interval_on = max(POLL_INTERVAL_ON, 10 * average_response_time)
+                    status = cmd.parameters[0]
 
                     if status == PowerStatus.ON:
-                        if not switch_is_on:
+                        if standby_announced:
+                            # It never actually went off, so the soundbar is as it was
+                            logger.info("Switch still ON after announcing standby")
+                            standby_announced = False
+                            switch_is_on = True
+                            last_poll_time = current_time
+                        elif not switch_is_on:
                             logger.info("Switch is ON")
                             switch_is_on = True
                             last_poll_time = current_time
                             # Spawn TurnSoundbarOnProcessor
                             logger.info("Spawning TurnSoundbarOnProcessor")
-                            eventbus.add_processor(TurnSoundbarOnProcessor(addresses))
+                            eventbus.add_processor(TurnSoundbarOnProcessor(addresses, power_cache))
                     else:
                         # Switch reported non-ON status
                         if switch_is_on:
                             logger.info("Switch turned off (status report)")
                             switch_is_on = False
+                            last_poll_time = current_time
+                            poll_interval_off = POLL_INTERVAL_OFF_MIN
                             logger.info("Switching active source to Chromecast")
-                            cmd = yield [CECCommand.build(
-                                destination=addresses.broadcast,
-                                opcode=CECOpcode.SET_STREAM_PATH,
-                                parameters=addresses.chromecast_physical
-                            )]
+                            cmd = yield [select_chromecast, from_switch, Sleep(poll_interval_off)]
                             continue
+                        # Still off - the next (backed off) interval runs from now
+                        last_poll_time = current_time
+                        if standby_announced:
+                            logger.info("Switch standby confirmed (status report)")
+                            standby_announced = False
+                            logger.info("Switching active source to Chromecast")
+                            cmd = yield [select_chromecast, from_switch, Sleep(poll_interval_off)]
+                            continue
+
+            # The Switch announcing standby means it's going off - but a broadcast standby
+            # also puts the TV to sleep, and selecting the Chromecast straight away could
+            # wake it again. Treat the Switch as off and let the next poll confirm it
+            # before switching. While already off, it's not a sign of life worth polling for
+            elif cmd.opcode == CECOpcode.STANDBY:
+                if switch_is_on:
+                    logger.info("Switch announced standby, confirming with the next poll")
+                    switch_is_on = False
+                    standby_announced = True
+                    waiting_for_poll_response = False
+                    poll_timed_out = False
+                    consecutive_timeouts = 0
+                    last_poll_time = current_time
+                    poll_interval_off = POLL_INTERVAL_OFF_MIN
+
+            # Any other traffic from the Switch while we think it's off means it may
+            # have woken up - poll now rather than waiting out the long off interval
+            # (unless it's just announced standby, when it's expected to be winding down)
+            elif not switch_is_on and not waiting_for_poll_response and not standby_announced:
+                logger.debug("Traffic from Switch while off, polling immediately")
+                last_poll_time = float('-inf')
+                poll_interval_off = POLL_INTERVAL_OFF_MIN
+
+            # Likewise, traffic from the Switch while it's on proves it's still there,
+            # so the next liveness poll can wait a full interval from now
+            elif switch_is_on:
+                consecutive_timeouts = 0
+                if not waiting_for_poll_response:
+                    last_poll_time = current_time
 
         # Send periodic poll if not waiting for response
         if not waiting_for_poll_response:
-            poll_interval = POLL_INTERVAL_ON if switch_is_on else POLL_INTERVAL_OFF
+            poll_interval = poll_interval_on if switch_is_on else poll_interval_off
             if (current_time - last_poll_time) >= poll_interval:
                 if switch_is_on:
                     logger.debug("Polling Switch status (on)")
                 else:
                     logger.debug("Polling Switch status (periodic check while off)")
-                cmd = yield [CECCommand.build(destination=addresses.switch, opcode=CECOpcode.GIVE_DEVICE_POWER_STATUS)]
+                    poll_interval_off = min(poll_interval_off * POLL_BACKOFF_FACTOR, POLL_INTERVAL_OFF_MAX)
+                pending_poll_timeout = min(poll_timeout, poll_interval / 2)
+                cmd = yield [poll_switch, from_switch, Sleep(pending_poll_timeout)]
                 last_poll_time = current_time
                 waiting_for_poll_response = True
+                poll_timed_out = False
                 poll_start_time = current_time
                 continue
 
-        # Wait for next event
-        cmd = yield []
+        # Wait for next event, or until the poll response times out / the next poll is due
+        if waiting_for_poll_response:
+            cmd = yield [from_switch, Sleep(poll_start_time + pending_poll_timeout - current_time)]
+        else:
+            poll_interval = poll_interval_on if switch_is_on else poll_interval_off
+            cmd = yield [from_switch, Sleep(last_poll_time + poll_interval - current_time)]
 
 
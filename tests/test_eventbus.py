@@ -7,7 +7,7 @@ Run with: pytest test_eventbus.py -v
 import pytest
 import time
 from cec_comms import MockCECComms, CECCommand
-from eventbus import CECEventBus
+from eventbus import CECEventBus, Match, Sleep
 from with_timeout import with_timeout
 
 
@@ -42,6 +42,13 @@ class TestCECCommand:
         assert cmd.opcode == 0x36
         assert cmd.parameters == b''
 
+    def test_parse_power_status_without_status_byte(self):
+        """Test that a REPORT_POWER_STATUS missing its status byte reads as STANDBY"""
+        cmd = CECCommand("50:90")
+
+        assert cmd.parameters == b'\x01'
+        assert cmd.command_string == "50:90"
+
     def test_build_command(self):
         """Test building a command for transmission"""
         cmd = CECCommand.build(destination=0, opcode=0x8F)
@@ -62,16 +69,58 @@ class TestCECCommand:
         assert cmd.opcode == 0x82
         assert cmd.parameters == b'\x10\x00'
 
+    def test_build_reuses_identical_commands(self):
+        """Test that building the same command twice returns the cached instance"""
+        cmd1 = CECCommand.build(destination=5, opcode=0x44, parameters=b'\x40')
+        cmd2 = CECCommand.build(destination=5, opcode=0x44, parameters=b'\x40')
+        cmd3 = CECCommand.build(destination=5, opcode=0x44, parameters=b'\x41')
+
+        assert cmd1 is cmd2
+        assert cmd1 is not cmd3
+        assert cmd3.command_string == "15:44:41"
+
+    def test_commands_have_no_instance_dict(self):
+        """Test that parsed and built commands use __slots__ storage"""
+        parsed = CECCommand("01:90:00")
+        built = CECCommand.build(destination=0, opcode=0x8F)
+
+        assert not hasattr(parsed, '__dict__')
+        assert not hasattr(built, '__dict__')
+
+        with pytest.raises(AttributeError):
+            built.extra = 1
+
     def test_str_representation(self):
         """Test string representation of command"""
         cmd = CECCommand("01:90:00")
         assert str(cmd) == "01:90:00"
 
+    def test_parse_returns_shared_instance(self):
+        """Test that parse() memoizes identical frames"""
+        cmd1 = CECCommand.parse("01:90:00")
+        cmd2 = CECCommand.parse("01:90:00")
+
+        assert cmd1 is cmd2
+        assert cmd1.initiator == 0
+        assert cmd1.opcode == 0x90
+        assert cmd1.parameters == b'\x00'
+
     def test_invalid_command_string(self):
         """Test that invalid command strings raise ValueError"""
         with pytest.raises(ValueError):
             CECCommand("10")  # Too short
 
+    def test_invalid_hex_digits(self):
+        """Test that non-hex characters raise ValueError"""
+        with pytest.raises(ValueError):
+            CECCommand("1G:8F")
+
+        with pytest.raises(ValueError):
+            CECCommand("10::8F")  # Empty field
+
+        with pytest.raises(ValueError):
+            CECCommand("1:8F")  # Bytes must be two hex digits
+
 
 class TestMockCECComms:
     """Test MockCECComms class"""
@@ -211,6 +260,36 @@ class TestCECEventBus:
         assert callback1_commands[0].command_string == "01:90:00"
         assert callback2_commands[0].command_string == "01:90:00"
 
+    def test_prefixed_command_string(self):
+        """Test that a ">>" prefix on a received frame is stripped"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        received = []
+        bus.add_callback(lambda cmd: received.append(cmd.command_string))
+
+        mock.simulate_received_command(">> 01:90:00")
+
+        assert received == ["01:90:00"]
+
+    def test_malformed_command_ignored(self):
+        """Test that malformed frames are dropped without reaching callbacks"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        received = []
+        bus.add_callback(lambda cmd: received.append(cmd.command_string))
+
+        assert bus._on_cec_command_internal("1G:8F") == 0
+        assert bus._on_cec_command_internal("10") == 0
+        mock.simulate_received_command("01:90:00")
+
+        assert received == ["01:90:00"]
+        assert CECCommand.is_valid("01:90:00")
+        assert not CECCommand.is_valid("01:9:00")
+
     def test_callback_exception_handling(self):
         """Test that exceptions in callbacks don't break the bus"""
         mock = MockCECComms()
@@ -407,6 +486,149 @@ class TestProcessors:
         # Processor should be complete
         assert len(bus._processors) == 0
 
+    def test_processor_with_match_only_receives_matching_frames(self):
+        """Test that a processor yielding a Match is only resumed for that frame"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        received = []
+
+        def matching_processor():
+            cmd = yield [CECCommand.build(destination=5, opcode=0x8F), Match(5, 0x90)]
+            received.append(cmd.command_string)
+
+            # Back to receiving every frame
+            cmd = yield []
+            received.append(cmd.command_string)
+            yield None
+
+        bus.add_processor(matching_processor())
+        assert mock.transmitted_commands == ["15:8F"]
+
+        # Unrelated frames, including a power status from another device
+        mock.simulate_received_command("01:90:00")
+        mock.simulate_received_command("4F:82:10:00")
+        assert received == []
+
+        mock.simulate_received_command("51:90:00")
+        assert received == ["51:90:00"]
+
+        mock.simulate_received_command("01:90:00")
+        assert received == ["51:90:00", "01:90:00"]
+        assert len(bus._processors) == 0
+
+    def test_match_without_opcode_receives_all_frames_from_initiator(self):
+        """Test that a Match with no opcode resumes the processor for any frame from that device"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        received = []
+
+        def matching_processor():
+            while True:
+                cmd = yield [Match(4)]
+                received.append(cmd.command_string)
+
+        bus.add_processor(matching_processor())
+
+        mock.simulate_received_command("01:90:00")
+        mock.simulate_received_command("4F:82:10:00")
+        mock.simulate_received_command("51:90:00")
+        mock.simulate_received_command("41:90:01")
+        assert received == ["4F:82:10:00", "41:90:01"]
+
+    def test_processor_sleep_resumes_with_none(self):
+        """Test that a processor yielding Sleep is resumed with None once it expires"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        received = []
+
+        def sleeping_processor():
+            cmd = yield [Match(5, 0x90), Sleep(0.05)]
+            received.append(cmd)
+            cmd = yield [Sleep(0.05)]
+            received.append(cmd)
+            yield None
+
+        bus.add_processor(sleeping_processor())
+
+        # Nothing due yet
+        bus.tick()
+        assert received == []
+
+        time.sleep(0.06)
+        bus.tick()
+        assert received == [None]
+
+        # A frame before the next timer expires resumes it instead
+        mock.simulate_received_command("01:90:00")
+        assert received[1].command_string == "01:90:00"
+        assert len(bus._processors) == 0
+
+    def test_frame_cancels_pending_sleep(self):
+        """Test that a timer set before a processor was resumed by a frame is ignored"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        received = []
+
+        def processor():
+            while True:
+                cmd = yield [Sleep(0.05)] if not received else []
+                received.append(cmd)
+
+        bus.add_processor(processor())
+        mock.simulate_received_command("01:90:00")
+
+        time.sleep(0.06)
+        bus.tick()
+        assert len(received) == 1
+        assert received[0].command_string == "01:90:00"
+
+    def test_timer_thread_resumes_processors(self):
+        """Test that start_timers() runs expired Sleeps without any frames arriving"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+        bus.start_timers()
+
+        def polling_processor():
+            yield [Sleep(0.05)]
+            yield [CECCommand.build(destination=0, opcode=0x8F), None]
+
+        bus.add_processor(polling_processor())
+
+        for _ in range(50):
+            if mock.transmitted_commands:
+                break
+            time.sleep(0.01)
+
+        bus.close()
+        assert mock.transmitted_commands == ["10:8F"]
+        assert len(bus._processors) == 0
+
+    def test_has_processor(self):
+        """Test that has_processor reports active processors by name"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        def waiting_processor():
+            yield [CECCommand.build(destination=0, opcode=0x8F), Match(0, 0x90)]
+            yield None
+
+        assert not bus.has_processor('waiting_processor')
+        bus.add_processor(waiting_processor())
+        assert bus.has_processor('waiting_processor')
+
+        mock.simulate_received_command("01:90:00")
+        assert not bus.has_processor('waiting_processor')
+
     def test_multiple_processors(self):
         """Test multiple processors running concurrently"""
         mock = MockCECComms()
@@ -488,6 +710,31 @@ class TestProcessors:
         assert good_processor_done[0] is True
         assert len(bus._processors) == 0
 
+    def test_own_frames_not_dispatched_to_processors(self):
+        """Test that frames sent from our own address only reach callbacks"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        callback_commands = []
+        received_count = [0]
+
+        def processor():
+            cmd = yield []
+            while True:
+                received_count[0] += 1
+                cmd = yield []
+
+        bus.add_callback(lambda cmd: callback_commands.append(cmd.command_string))
+        bus.add_processor(processor())
+
+        mock.simulate_received_command("10:8F")  # Our own poll
+        assert callback_commands == ["10:8F"]
+        assert received_count[0] == 0
+
+        mock.simulate_received_command("01:90:00")  # TV response
+        assert received_count[0] == 1
+
     def test_processor_with_callbacks(self):
         """Test that processors and callbacks can coexist"""
         mock = MockCECComms()
@@ -584,6 +831,20 @@ class TestTimeoutDecorator:
         assert len(bus._processors) == 0
         assert completed[0] is False
 
+    def test_termination_passed_through_unchanged(self):
+        """Test that a terminating yield reaches the bus as is, without a timeout Sleep added"""
+        terminate = (None,)
+
+        @with_timeout(5.0)
+        def terminating_processor():
+            cmd = yield [CECCommand.build(destination=0, opcode=0x8F), Match(0, 0x90)]
+            yield terminate
+
+        gen = terminating_processor()
+        first = next(gen)
+        assert any(isinstance(item, Sleep) for item in first)
+        assert gen.send(CECCommand.parse("01:90:00")) is terminate
+
     def test_timeout_preserves_function_name(self):
         """Test that decorator preserves function name for logging"""
         @with_timeout(5.0)
@@ -688,3 +949,26 @@ class TestTimeoutDecorator:
 
         assert received[0] is True
         assert len(bus._processors) == 0
+
+    def test_timeout_fires_without_frames(self):
+        """Test that a processor waiting on a Match still times out when nothing arrives"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        @with_timeout(0.1)  # 100ms
+        def matching_processor():
+            yield [CECCommand.build(destination=0, opcode=0x8F), Match(0, 0x90)]
+            yield None
+
+        bus.add_processor(matching_processor())
+        assert len(bus._processors) == 1
+
+        # Unrelated frames don't resume it
+        mock.simulate_received_command("4F:82:10:00")
+        assert len(bus._processors) == 1
+
+        # The wrapper's timer does
+        time.sleep(0.15)
+        bus.tick()
+        assert len(bus._processors) == 0
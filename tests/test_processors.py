@@ -1,9 +1,9 @@
 from unittest.mock import patch, Mock
 import pytest
 
-from cec_comms import MockCECComms
+from cec_comms import CECCommand, MockCECComms
 from eventbus import CECEventBus
-from processors import Addresses, SoundbarOnWithTvProcessor, SwitchStatusProcessor
+from processors import Addresses, PowerStatusCache, SetSoundbarVolumeProcessor, SoundbarOnWithTvProcessor, SwitchStatusProcessor, TurnSoundbarOnProcessor
 
 
 @pytest.fixture
@@ -21,7 +21,7 @@ class TestSoundbarOnWithTvProcessor:
         bus = CECEventBus(mock)
         bus.init()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
 
         # Should send TV power status request
@@ -29,7 +29,7 @@ class TestSoundbarOnWithTvProcessor:
         assert mock.transmitted_commands[0] == "10:8F"  # Request TV power status
 
         # Simulate TV is ON
-        with patch('time.time', return_value=1000.1):
+        with patch('time.monotonic', return_value=1000.1):
             mock.simulate_received_command("01:90:00")  # TV reports ON
 
         # SoundbarOnWithTvProcessor should spawn TurnSoundbarOnProcessor
@@ -38,7 +38,7 @@ class TestSoundbarOnWithTvProcessor:
         assert mock.transmitted_commands[1] == "15:8F"  # Request soundbar power status
 
         # Simulate soundbar is OFF (STANDBY)
-        with patch('time.time', return_value=1000.2):
+        with patch('time.monotonic', return_value=1000.2):
             mock.simulate_received_command("51:90:01")  # Soundbar reports STANDBY
 
         # Should send power toggle to soundbar
@@ -56,21 +56,21 @@ class TestSoundbarOnWithTvProcessor:
         bus = CECEventBus(mock)
         bus.init()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
 
         # TV power status request
         assert mock.transmitted_commands[0] == "10:8F"
 
         # Simulate TV is ON
-        with patch('time.time', return_value=1000.1):
+        with patch('time.monotonic', return_value=1000.1):
             mock.simulate_received_command("01:90:00")
 
         # Soundbar power status request
         assert mock.transmitted_commands[1] == "15:8F"
 
         # Simulate soundbar is already ON
-        with patch('time.time', return_value=1000.2):
+        with patch('time.monotonic', return_value=1000.2):
             mock.simulate_received_command("51:90:00")  # Soundbar reports ON
 
         # Should NOT send power toggle
@@ -85,14 +85,14 @@ class TestSoundbarOnWithTvProcessor:
         bus = CECEventBus(mock)
         bus.init()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
 
         # TV power status request
         assert mock.transmitted_commands[0] == "10:8F"
 
         # Simulate TV is OFF (STANDBY)
-        with patch('time.time', return_value=1000.1):
+        with patch('time.monotonic', return_value=1000.1):
             mock.simulate_received_command("01:90:01")  # TV reports STANDBY
 
         # Should NOT request soundbar status or send any more commands
@@ -108,7 +108,7 @@ class TestSoundbarOnWithTvProcessor:
         bus.init()
 
         # Start processor
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
 
         # Initial request
@@ -116,11 +116,11 @@ class TestSoundbarOnWithTvProcessor:
         assert mock.transmitted_commands[0] == "10:8F"
 
         # Respond to initial poll
-        with patch('time.time', return_value=1000.1):
+        with patch('time.monotonic', return_value=1000.1):
             mock.simulate_received_command("01:90:01")  # TV OFF
 
         # Advance time to trigger next poll (500ms interval)
-        with patch('time.time', return_value=1000.6):
+        with patch('time.monotonic', return_value=1000.6):
             mock.simulate_received_command("00:00")  # Unrelated event to trigger processing
 
         # Should have sent second poll
@@ -128,17 +128,46 @@ class TestSoundbarOnWithTvProcessor:
         assert mock.transmitted_commands[1] == "10:8F"
 
         # Respond to second poll
-        with patch('time.time', return_value=1000.7):
+        with patch('time.monotonic', return_value=1000.7):
             mock.simulate_received_command("01:90:01")  # TV still OFF
 
         # Advance time for third poll
-        with patch('time.time', return_value=1001.2):
+        with patch('time.monotonic', return_value=1001.2):
             mock.simulate_received_command("00:00")  # Unrelated event
 
         # Should have sent third poll
         assert len(mock.transmitted_commands) == 3
         assert mock.transmitted_commands[2] == "10:8F"
 
+    def test_polling_driven_by_timers(self, addresses):
+        """Test that polls and poll timeouts happen via bus timers when no frames arrive"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
+        assert mock.transmitted_commands == ["10:8F"]
+
+        # Response to the initial poll - next poll due in 500ms
+        with patch('time.monotonic', return_value=1000.1):
+            mock.simulate_received_command("01:90:01")  # TV OFF
+
+        # Not due yet
+        with patch('time.monotonic', return_value=1000.5):
+            bus.tick()
+        assert len(mock.transmitted_commands) == 1
+
+        # Poll interval expires with no traffic at all
+        with patch('time.monotonic', return_value=1000.6):
+            bus.tick()
+        assert mock.transmitted_commands == ["10:8F", "10:8F"]
+
+        # No response - the poll timeout expires and the next poll follows straight away
+        with patch('time.monotonic', return_value=1002.7):
+            bus.tick()
+        assert mock.transmitted_commands == ["10:8F", "10:8F", "10:8F"]
+
     def test_tv_state_transition(self, addresses):
         """Test that processor tracks TV state changes"""
         mock = MockCECComms()
@@ -150,54 +179,80 @@ class TestSoundbarOnWithTvProcessor:
         mock_add_processor = Mock()
 
         # Start processor
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor = original_add_processor
             bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
             bus.add_processor = mock_add_processor
 
         # TV starts OFF
-        with patch('time.time', return_value=1000.1):
+        with patch('time.monotonic', return_value=1000.1):
             mock.simulate_received_command("01:90:01")  # TV OFF
 
         # No soundbar processor spawned
         assert mock_add_processor.call_count == 0
 
         # Advance time and poll again
-        with patch('time.time', return_value=1000.6):
+        with patch('time.monotonic', return_value=1000.6):
             mock.simulate_received_command("00:00")  # Trigger processing
 
         # TV now reports ON
-        with patch('time.time', return_value=1000.7):
+        with patch('time.monotonic', return_value=1000.7):
             mock.simulate_received_command("01:90:00")  # TV ON
 
         # Should have spawned TurnSoundbarOnProcessor
         assert mock_add_processor.call_count == 1
 
         # Advance time and poll again
-        with patch('time.time', return_value=1001.2):
+        with patch('time.monotonic', return_value=1001.2):
             mock.simulate_received_command("00:00")  # Trigger processing
 
         # TV still ON
-        with patch('time.time', return_value=1001.3):
+        with patch('time.monotonic', return_value=1001.3):
             mock.simulate_received_command("01:90:00")  # TV ON
 
         # Should spawn TurnSoundbarOnProcessor again (duplicate prevention in eventbus)
         assert mock_add_processor.call_count == 2
 
+    def test_no_second_soundbar_processor_while_one_in_flight(self, addresses):
+        """Test that a TV ON report is ignored while TurnSoundbarOnProcessor still waits for the soundbar"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        with patch('processors.TurnSoundbarOnProcessor', wraps=TurnSoundbarOnProcessor) as turn_on:
+            with patch('time.monotonic', return_value=1000.0):
+                bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
+
+            # TV reports ON - TurnSoundbarOnProcessor spawned and asks the soundbar
+            with patch('time.monotonic', return_value=1000.1):
+                mock.simulate_received_command("01:90:00")
+            assert mock.transmitted_commands == ["10:8F", "15:8F"]
+
+            # Next TV poll, still ON, but the soundbar hasn't answered yet
+            with patch('time.monotonic', return_value=1000.6):
+                bus.tick()
+            with patch('time.monotonic', return_value=1000.7):
+                mock.simulate_received_command("01:90:00")
+
+        # No second processor created, and the soundbar wasn't asked again
+        assert turn_on.call_count == 1
+        assert mock.transmitted_commands == ["10:8F", "15:8F", "10:8F"]
+        assert len(bus._processors) == 2
+
     def test_filters_unrelated_traffic(self, addresses):
         """Test that processor filters out unrelated CEC traffic"""
         mock = MockCECComms()
         bus = CECEventBus(mock)
         bus.init()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses))
 
         # TV power status request sent
         assert mock.transmitted_commands[0] == "10:8F"
 
         # Simulate unrelated traffic
-        with patch('time.time', return_value=1000.1):
+        with patch('time.monotonic', return_value=1000.1):
             mock.simulate_received_command("4F:82:10:00")  # Switch active source
             mock.simulate_received_command("0F:87:00:E0:91")  # TV vendor ID
 
@@ -205,7 +260,7 @@ class TestSoundbarOnWithTvProcessor:
         assert len(mock.transmitted_commands) == 1
 
         # Now send TV response
-        with patch('time.time', return_value=1000.2):
+        with patch('time.monotonic', return_value=1000.2):
             mock.simulate_received_command("01:90:00")  # TV ON
 
         # Should have spawned TurnSoundbarOnProcessor and requested soundbar status
@@ -222,7 +277,7 @@ class TestSwitchStatusProcessor:
         bus = CECEventBus(mock)
         bus.init()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
 
         # Should send initial status request
@@ -230,8 +285,8 @@ class TestSwitchStatusProcessor:
         assert mock.transmitted_commands[0] == "14:8F"  # Request Switch power status
 
         # Simulate no response (timeout) - advance time past timeout
-        with patch('time.time', return_value=1002.5):  # 2.5 seconds later (past 2.0s timeout)
-            mock.simulate_received_command("01:90:00")  # Any unrelated command to trigger processing
+        with patch('time.monotonic', return_value=1002.5):  # 2.5 seconds later (past 2.0s timeout)
+            bus.tick()  # Run expired timers
 
         # Should not send Chromecast switch command (Switch wasn't on)
         assert len(mock.transmitted_commands) == 1
@@ -249,7 +304,7 @@ class TestSwitchStatusProcessor:
         original_add_processor = bus.add_processor
         mock_add_processor = Mock()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor = original_add_processor
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
             bus.add_processor = mock_add_processor
@@ -258,7 +313,7 @@ class TestSwitchStatusProcessor:
         assert mock.transmitted_commands[0] == "14:8F"
 
         # Simulate Switch responding as ON
-        with patch('time.time', return_value=1000.5):
+        with patch('time.monotonic', return_value=1000.5):
             mock.simulate_received_command("41:90:00")  # Switch reports ON
 
         # Should have called add_processor to spawn TurnSoundbarOnProcessor
@@ -280,7 +335,7 @@ class TestSwitchStatusProcessor:
         original_add_processor = bus.add_processor
         mock_add_processor = Mock()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor = original_add_processor
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
             bus.add_processor = mock_add_processor
@@ -289,11 +344,11 @@ class TestSwitchStatusProcessor:
         assert mock.transmitted_commands[0] == "14:8F"
 
         # Simulate timeout (Switch is off)
-        with patch('time.time', return_value=1002.5):
-            mock.simulate_received_command("01:90:00")  # Unrelated command
+        with patch('time.monotonic', return_value=1002.5):
+            bus.tick()  # Run expired timers
 
         # Now simulate Switch broadcasting ACTIVE_SOURCE
-        with patch('time.time', return_value=1010.0):
+        with patch('time.monotonic', return_value=1010.0):
             mock.simulate_received_command("4F:82:10:00")  # Switch ACTIVE_SOURCE
 
         # Should have called add_processor to spawn TurnSoundbarOnProcessor
@@ -302,6 +357,65 @@ class TestSwitchStatusProcessor:
         # Should not send any more commands (TurnSoundbarOnProcessor was mocked)
         assert len(mock.transmitted_commands) == 1
 
+    def test_switch_traffic_while_off_triggers_immediate_poll(self, addresses):
+        """Test that other traffic from the Switch while off triggers a poll without waiting for the next one"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+
+        # Initial poll times out - Switch is off
+        with patch('time.monotonic', return_value=1002.5):
+            bus.tick()  # Run expired timers
+
+        assert len(mock.transmitted_commands) == 1
+
+        # Before the next poll is due (2s after the timeout), the Switch broadcasts its vendor ID
+        with patch('time.monotonic', return_value=1003.0):
+            mock.simulate_received_command("4F:87:00:00:01")
+
+        # Should poll the Switch straight away
+        assert len(mock.transmitted_commands) == 2
+        assert mock.transmitted_commands[1] == "14:8F"
+
+    def test_switch_traffic_while_on_defers_poll(self, addresses):
+        """Test that other traffic from the Switch while on pushes back the next poll"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        # Mock add_processor to prevent spawning TurnSoundbarOnProcessor
+        original_add_processor = bus.add_processor
+        mock_add_processor = Mock()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor = original_add_processor
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+            bus.add_processor = mock_add_processor
+
+        # Simulate Switch responding as ON
+        with patch('time.monotonic', return_value=1000.5):
+            mock.simulate_received_command("41:90:00")
+
+        # Switch sends some other traffic shortly before the next poll is due
+        with patch('time.monotonic', return_value=1004.0):
+            mock.simulate_received_command("4F:87:00:00:01")
+
+        # 5s after the ON report, but only 1.5s after the traffic - no poll yet
+        with patch('time.monotonic', return_value=1005.5):
+            bus.tick()  # Run expired timers
+
+        assert len(mock.transmitted_commands) == 1
+
+        # 5s after the traffic - poll is due
+        with patch('time.monotonic', return_value=1009.0):
+            bus.tick()  # Run expired timers
+
+        assert len(mock.transmitted_commands) == 2
+        assert mock.transmitted_commands[1] == "14:8F"
+
     def test_switch_turns_off_via_poll_timeout(self, addresses):
         """Test Switch turning off detected via 3 consecutive poll timeouts"""
         mock = MockCECComms()
@@ -313,7 +427,7 @@ class TestSwitchStatusProcessor:
         mock_add_processor = Mock()
 
         # Start with Switch on
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor = original_add_processor
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
             bus.add_processor = mock_add_processor
@@ -322,7 +436,7 @@ class TestSwitchStatusProcessor:
         assert mock.transmitted_commands[0] == "14:8F"
 
         # Simulate Switch responding as ON
-        with patch('time.time', return_value=1000.5):
+        with patch('time.monotonic', return_value=1000.5):
             mock.simulate_received_command("41:90:00")  # Switch reports ON
 
         # Should have spawned TurnSoundbarOnProcessor
@@ -330,45 +444,45 @@ class TestSwitchStatusProcessor:
 
         # === First poll and timeout ===
         # Advance time to trigger first poll (5 seconds after Switch turned on)
-        with patch('time.time', return_value=1005.5):
-            mock.simulate_received_command("01:90:00")  # Unrelated event to trigger processing
+        with patch('time.monotonic', return_value=1005.5):
+            bus.tick()  # Run expired timers
 
         assert len(mock.transmitted_commands) == 2
         assert mock.transmitted_commands[1] == "14:8F"  # First poll
 
         # First timeout (no response) - should NOT trigger Chromecast switch yet
-        with patch('time.time', return_value=1008.0):  # 2.5 seconds after poll
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1008.0):  # 2.5 seconds after poll
+            bus.tick()  # Run expired timers
 
         # Should NOT have sent Chromecast switch command (only 1 timeout)
         assert len(mock.transmitted_commands) == 2
 
         # === Second poll and timeout ===
         # Advance time to trigger second poll (5 seconds after first poll)
-        with patch('time.time', return_value=1010.5):
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1010.5):
+            bus.tick()  # Run expired timers
 
         assert len(mock.transmitted_commands) == 3
         assert mock.transmitted_commands[2] == "14:8F"  # Second poll
 
         # Second timeout - should NOT trigger Chromecast switch yet
-        with patch('time.time', return_value=1013.0):
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1013.0):
+            bus.tick()  # Run expired timers
 
         # Should NOT have sent Chromecast switch command (only 2 timeouts)
         assert len(mock.transmitted_commands) == 3
 
         # === Third poll and timeout ===
         # Advance time to trigger third poll (5 seconds after second poll)
-        with patch('time.time', return_value=1015.5):
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1015.5):
+            bus.tick()  # Run expired timers
 
         assert len(mock.transmitted_commands) == 4
         assert mock.transmitted_commands[3] == "14:8F"  # Third poll
 
         # Third timeout - NOW should trigger Chromecast switch
-        with patch('time.time', return_value=1018.0):
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1018.0):
+            bus.tick()  # Run expired timers
 
         # Should have sent Chromecast switch command (3 consecutive timeouts)
         assert len(mock.transmitted_commands) == 5
@@ -385,52 +499,52 @@ class TestSwitchStatusProcessor:
         mock_add_processor = Mock()
 
         # Start with Switch on
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor = original_add_processor
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
             bus.add_processor = mock_add_processor
 
         # Simulate Switch responding as ON
-        with patch('time.time', return_value=1000.5):
+        with patch('time.monotonic', return_value=1000.5):
             mock.simulate_received_command("41:90:00")  # Switch reports ON
 
         # === First poll and timeout ===
-        with patch('time.time', return_value=1005.5):
-            mock.simulate_received_command("01:90:00")  # Trigger poll
+        with patch('time.monotonic', return_value=1005.5):
+            bus.tick()  # Trigger poll
 
         # First timeout
-        with patch('time.time', return_value=1008.0):
-            mock.simulate_received_command("01:90:00")
+        with patch('time.monotonic', return_value=1008.0):
+            bus.tick()  # Run expired timers
 
         # === Second poll and timeout ===
-        with patch('time.time', return_value=1010.5):
-            mock.simulate_received_command("01:90:00")  # Trigger second poll
+        with patch('time.monotonic', return_value=1010.5):
+            bus.tick()  # Trigger second poll
 
         # Second timeout
-        with patch('time.time', return_value=1013.0):
-            mock.simulate_received_command("01:90:00")
+        with patch('time.monotonic', return_value=1013.0):
+            bus.tick()  # Run expired timers
 
         # === Third poll - but this time Switch responds! ===
-        with patch('time.time', return_value=1015.5):
-            mock.simulate_received_command("01:90:00")  # Trigger third poll
+        with patch('time.monotonic', return_value=1015.5):
+            bus.tick()  # Trigger third poll
 
         # Switch responds - this should reset the timeout counter
-        with patch('time.time', return_value=1016.0):
+        with patch('time.monotonic', return_value=1016.0):
             mock.simulate_received_command("41:90:00")  # Switch reports ON
 
         # Now simulate 2 more timeouts - should NOT trigger Chromecast switch
         # because the counter was reset
-        with patch('time.time', return_value=1021.0):
-            mock.simulate_received_command("01:90:00")  # Trigger poll
+        with patch('time.monotonic', return_value=1021.0):
+            bus.tick()  # Trigger poll
 
-        with patch('time.time', return_value=1024.0):
-            mock.simulate_received_command("01:90:00")  # First timeout after reset
+        with patch('time.monotonic', return_value=1024.0):
+            bus.tick()  # First timeout after reset
 
-        with patch('time.time', return_value=1026.0):
-            mock.simulate_received_command("01:90:00")  # Trigger another poll
+        with patch('time.monotonic', return_value=1026.0):
+            bus.tick()  # Trigger another poll
 
-        with patch('time.time', return_value=1029.0):
-            mock.simulate_received_command("01:90:00")  # Second timeout after reset
+        with patch('time.monotonic', return_value=1029.0):
+            bus.tick()  # Second timeout after reset
 
         # Should NOT have sent Chromecast switch command (only 2 timeouts since reset)
         # Count the Chromecast commands
@@ -448,33 +562,140 @@ class TestSwitchStatusProcessor:
         mock_add_processor = Mock()
 
         # Start with Switch on
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor = original_add_processor
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
             bus.add_processor = mock_add_processor
 
         # Simulate Switch responding as ON
-        with patch('time.time', return_value=1000.5):
+        with patch('time.monotonic', return_value=1000.5):
             mock.simulate_received_command("41:90:00")  # Switch reports ON
 
         # Should have spawned TurnSoundbarOnProcessor
         assert mock_add_processor.call_count == 1
 
         # Advance time to trigger poll
-        with patch('time.time', return_value=1005.5):
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1005.5):
+            bus.tick()  # Run expired timers
 
         # Should have sent a poll
         assert mock.transmitted_commands[1] == "14:8F"
 
         # Simulate Switch responding with STANDBY status
-        with patch('time.time', return_value=1006.0):
+        with patch('time.monotonic', return_value=1006.0):
             mock.simulate_received_command("41:90:01")  # Switch reports STANDBY
 
         # Should have sent Chromecast switch command
         assert len(mock.transmitted_commands) == 3
         assert mock.transmitted_commands[2] == "1F:86:30:00"  # SET_STREAM_PATH to Chromecast
 
+    def test_switch_turns_off_via_standby(self, addresses):
+        """Test that the Switch announcing standby switches to Chromecast once a poll confirms it"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        # Mock add_processor to prevent spawning TurnSoundbarOnProcessor
+        original_add_processor = bus.add_processor
+        mock_add_processor = Mock()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor = original_add_processor
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+            bus.add_processor = mock_add_processor
+
+        # Simulate Switch responding as ON
+        with patch('time.monotonic', return_value=1000.1):
+            mock.simulate_received_command("41:90:00")
+
+        # Switch broadcasts STANDBY - nothing sent yet, the TV may be going to sleep too
+        with patch('time.monotonic', return_value=1004.0):
+            mock.simulate_received_command("4F:36")
+
+        assert mock.transmitted_commands == ["14:8F"]
+
+        # Further standby frames neither trigger a poll nor anything else
+        with patch('time.monotonic', return_value=1004.5):
+            mock.simulate_received_command("4F:36")
+
+        assert mock.transmitted_commands == ["14:8F"]
+
+        # 2s later the Switch is polled, and doesn't answer - now switch to Chromecast
+        with patch('time.monotonic', return_value=1006.0):
+            bus.tick()
+        assert mock.transmitted_commands == ["14:8F", "14:8F"]
+
+        with patch('time.monotonic', return_value=1006.6):
+            bus.tick()
+        assert mock.transmitted_commands == ["14:8F", "14:8F", "1F:86:30:00"]
+
+    def test_switch_standby_not_confirmed(self, addresses):
+        """Test that a Switch still answering ON after announcing standby is left alone"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        # Mock add_processor to prevent spawning TurnSoundbarOnProcessor
+        original_add_processor = bus.add_processor
+        mock_add_processor = Mock()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor = original_add_processor
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+            bus.add_processor = mock_add_processor
+
+        # Simulate Switch responding as ON
+        with patch('time.monotonic', return_value=1000.1):
+            mock.simulate_received_command("41:90:00")
+
+        with patch('time.monotonic', return_value=1004.0):
+            mock.simulate_received_command("4F:36")
+
+        # Confirmation poll is answered ON
+        with patch('time.monotonic', return_value=1006.0):
+            bus.tick()
+        with patch('time.monotonic', return_value=1006.1):
+            mock.simulate_received_command("41:90:00")
+
+        # No switch to Chromecast, and no second soundbar turn-on
+        assert mock.transmitted_commands == ["14:8F", "14:8F"]
+        assert mock_add_processor.call_count == 1
+
+    def test_switch_inactive_source_is_not_off(self, addresses):
+        """Test that the Switch giving up the active source (e.g. another TV input chosen) isn't treated as off"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        # Mock add_processor to prevent spawning TurnSoundbarOnProcessor
+        original_add_processor = bus.add_processor
+        mock_add_processor = Mock()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor = original_add_processor
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+            bus.add_processor = mock_add_processor
+
+        # Simulate Switch responding as ON
+        with patch('time.monotonic', return_value=1000.1):
+            mock.simulate_received_command("41:90:00")
+
+        # Switch sends INACTIVE_SOURCE to the TV - it's still on
+        with patch('time.monotonic', return_value=1004.0):
+            mock.simulate_received_command("40:9D:10:00")
+
+        assert mock.transmitted_commands == ["14:8F"]
+
+        # It keeps answering its liveness polls, so the input is never overridden
+        with patch('time.monotonic', return_value=1009.1):
+            bus.tick()
+        with patch('time.monotonic', return_value=1009.2):
+            mock.simulate_received_command("41:90:00")
+
+        assert mock.transmitted_commands == ["14:8F", "14:8F"]
+        assert "1F:86:30:00" not in mock.transmitted_commands
+        assert mock_add_processor.call_count == 1
+
     def test_periodic_polling_while_on(self, addresses):
         """Test that Switch is polled periodically while on"""
         mock = MockCECComms()
@@ -486,50 +707,155 @@ class TestSwitchStatusProcessor:
         mock_add_processor = Mock()
 
         # Start with Switch on
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor = original_add_processor
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
             bus.add_processor = mock_add_processor
 
         # Simulate Switch responding as ON
-        with patch('time.time', return_value=1000.5):
+        with patch('time.monotonic', return_value=1000.5):
             mock.simulate_received_command("41:90:00")  # Switch reports ON
 
         # Should have spawned TurnSoundbarOnProcessor
         assert mock_add_processor.call_count == 1
 
         # Advance time to trigger first poll (5 second interval)
-        with patch('time.time', return_value=1005.5):
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1005.5):
+            bus.tick()  # Run expired timers
 
         assert len(mock.transmitted_commands) == 2
         assert mock.transmitted_commands[1] == "14:8F"  # First poll
 
         # Respond to poll
-        with patch('time.time', return_value=1006.0):
+        with patch('time.monotonic', return_value=1006.0):
             mock.simulate_received_command("41:90:00")  # Switch still ON
 
         # Advance time to trigger second poll
-        with patch('time.time', return_value=1011.5):
-            mock.simulate_received_command("01:90:00")  # Unrelated event
+        with patch('time.monotonic', return_value=1011.5):
+            bus.tick()  # Run expired timers
 
         assert len(mock.transmitted_commands) == 3
         assert mock.transmitted_commands[2] == "14:8F"  # Second poll
 
+    def test_late_poll_response_is_not_a_timeout(self, addresses):
+        """Test that a reply arriving after the learnt timeout still counts as the Switch being there"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        # Mock add_processor to prevent spawning TurnSoundbarOnProcessor
+        original_add_processor = bus.add_processor
+        mock_add_processor = Mock()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor = original_add_processor
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+            bus.add_processor = mock_add_processor
+
+        # Switch answers within 100ms - timeout becomes the 500ms minimum
+        with patch('time.monotonic', return_value=1000.1):
+            mock.simulate_received_command("41:90:00")  # Switch reports ON
+
+        # The bus gets busy: the next poll times out, but is answered 1.5s after it was sent
+        with patch('time.monotonic', return_value=1005.1):
+            bus.tick()
+        with patch('time.monotonic', return_value=1005.6):
+            bus.tick()
+        with patch('time.monotonic', return_value=1006.6):
+            mock.simulate_received_command("41:90:00")  # Switch reports ON, late
+
+        # Two more polls time out and are never answered - that's only two in a row
+        for poll_time in (1013.2, 1021.4):
+            with patch('time.monotonic', return_value=poll_time):
+                bus.tick()
+            with patch('time.monotonic', return_value=poll_time + 1.7):
+                bus.tick()
+
+        # Never considered off
+        assert mock.transmitted_commands == ["14:8F", "14:8F", "14:8F", "14:8F"]
+
+    def test_poll_timeout_grows_with_slow_responses(self, addresses):
+        """Test that the poll timeout follows a slow Switch above the initial 2s"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        # Mock add_processor to prevent spawning TurnSoundbarOnProcessor
+        original_add_processor = bus.add_processor
+        mock_add_processor = Mock()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor = original_add_processor
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+            bus.add_processor = mock_add_processor
+        with patch('time.monotonic', return_value=1000.1):
+            mock.simulate_received_command("41:90:00")  # Switch reports ON
+
+        # Run the bus in 100ms steps. The Switch answers its next 8 polls 3s after
+        # each is sent, then stops answering
+        poll_times = []
+        chromecast_time = None
+        for tenths in range(10002, 30000):
+            now = tenths / 10
+            with patch('time.monotonic', return_value=now):
+                if poll_times and len(poll_times) <= 8 and abs(now - poll_times[-1] - 3.0) < 0.05:
+                    mock.simulate_received_command("41:90:00")  # Switch reports ON
+                bus.tick()
+            if mock.transmitted_commands[-1] == "1F:86:30:00":
+                chromecast_time = now
+                break
+            if len(mock.transmitted_commands) > len(poll_times) + 1:
+                poll_times.append(now)
+
+        # The last of the 3 unanswered polls was given a timeout of around twice 3s
+        assert chromecast_time is not None
+        assert len(poll_times) == 11
+        assert chromecast_time - poll_times[-1] > 5.0
+
+    def test_polls_back_off_while_off(self, addresses):
+        """Test that polls while the Switch is off get further apart, until it shows signs of life"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor(SwitchStatusProcessor(bus, addresses))
+
+        # Run the bus timers in 100ms steps with the Switch never answering
+        poll_times = []
+        for tenths in range(10001, 10200):
+            with patch('time.monotonic', return_value=tenths / 10):
+                bus.tick()
+            if len(mock.transmitted_commands) > len(poll_times) + 1:
+                poll_times.append(tenths / 10)
+
+        # 2s initial timeout, then 2s, 3s, 4.5s... between each poll's timeout and the next
+        assert poll_times == [1004.0, 1008.0, 1014.0]
+
+        # Traffic from the Switch resets the backoff - polled now, and the schedule starts over
+        with patch('time.monotonic', return_value=1020.0):
+            mock.simulate_received_command("4F:87:00:00:01")
+        assert len(mock.transmitted_commands) == 5
+        with patch('time.monotonic', return_value=1021.0):
+            bus.tick()  # Timed out after half the 2s interval
+        with patch('time.monotonic', return_value=1024.0):
+            bus.tick()
+        assert len(mock.transmitted_commands) == 6
+
     def test_filters_unrelated_traffic(self, addresses):
         """Test that processor correctly filters unrelated CEC traffic"""
         mock = MockCECComms()
         bus = CECEventBus(mock)
         bus.init()
 
-        with patch('time.time', return_value=1000.0):
+        with patch('time.monotonic', return_value=1000.0):
             bus.add_processor(SwitchStatusProcessor(bus, addresses))
 
         # Initial request sent
         assert len(mock.transmitted_commands) == 1
 
         # Send various unrelated commands
-        with patch('time.time', return_value=1000.5):
+        with patch('time.monotonic', return_value=1000.5):
             mock.simulate_received_command("01:90:00")  # TV power status
             mock.simulate_received_command("51:90:01")  # Soundbar power status
             mock.simulate_received_command("0F:87:00:E0:91")  # Vendor ID
@@ -539,3 +865,130 @@ class TestSwitchStatusProcessor:
 
         # Processor should still be active
         assert len(bus._processors) == 1
+
+
+class TestSetSoundbarVolumeProcessor:
+    """Test SetSoundbarVolumeProcessor"""
+
+    def test_volume_already_at_target_sends_nothing(self, addresses):
+        """Test that no volume keys are sent when the soundbar is already at target"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor(SetSoundbarVolumeProcessor(addresses, 0x20))
+            assert mock.transmitted_commands == ["15:8F"]  # Request soundbar power status
+
+            mock.simulate_received_command("51:90:00")  # Soundbar reports ON
+            assert mock.transmitted_commands[1] == "15:71"  # Request audio status
+
+            mock.simulate_received_command("51:7A:20")  # Volume already 0x20
+
+        # No volume keys sent and processor finished
+        assert len(mock.transmitted_commands) == 2
+        assert len(bus._processors) == 0
+
+    def test_volume_below_target_steps_up(self, addresses):
+        """Test that volume up is pressed enough times to reach the target"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor(SetSoundbarVolumeProcessor(addresses, 0x20))
+            mock.simulate_received_command("51:90:00")  # Soundbar reports ON
+            mock.simulate_received_command("01:7A:10")  # Audio status from another device - ignored
+            mock.simulate_received_command("51:7A:1B")  # Volume 0x1B, 5 below target
+
+        # 3 steps of 2 (ceiling), each a press/release pair sent to the TV
+        assert mock.transmitted_commands[2:] == ["10:44:41", "10:45"] * 3
+        assert len(bus._processors) == 0
+
+
+class TestPowerStatusCache:
+    """Test PowerStatusCache"""
+
+    def test_records_reported_status_until_expiry(self):
+        """Test that reported status is returned until it is older than the TTL"""
+        cache = PowerStatusCache()
+
+        with patch('time.monotonic', return_value=1000.0):
+            cache.observe(CECCommand.parse("51:90:00"))  # Soundbar reports ON
+            cache.observe(CECCommand.parse("01:36"))  # Not a status report
+
+        with patch('time.monotonic', return_value=1002.9):
+            assert cache.get(5) == 0x00
+            assert cache.get(0) is None
+
+        with patch('time.monotonic', return_value=1003.1):
+            assert cache.get(5) is None
+            assert cache.get(5, max_age=10.0) == 0x00
+
+        cache.invalidate(5)
+        assert cache.get(5, max_age=10.0) is None
+
+    def test_soundbar_poll_skipped_when_recently_on(self, addresses):
+        """Test that TurnSoundbarOnProcessor skips polling a soundbar that just reported ON"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+        cache = PowerStatusCache()
+        bus.add_callback(cache.observe)
+
+        with patch('time.monotonic', return_value=1000.0):
+            mock.simulate_received_command("51:90:00")  # Soundbar reports ON (seen passively)
+
+        with patch('time.monotonic', return_value=1001.0):
+            bus.add_processor(TurnSoundbarOnProcessor(addresses, cache))
+
+        # Finished straight away without asking the soundbar
+        assert mock.transmitted_commands == []
+        assert len(bus._processors) == 0
+
+    def test_soundbar_polled_and_cache_invalidated_before_toggle(self, addresses):
+        """Test that TurnSoundbarOnProcessor polls without a cached ON, and forgets the status it toggles"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+        cache = PowerStatusCache()
+        bus.add_callback(cache.observe)
+
+        with patch('time.monotonic', return_value=1000.0):
+            mock.simulate_received_command("51:90:00")  # Soundbar reports ON, but too long ago
+
+        with patch('time.monotonic', return_value=1010.0):
+            bus.add_processor(TurnSoundbarOnProcessor(addresses, cache))
+            assert mock.transmitted_commands == ["15:8F"]
+
+            mock.simulate_received_command("51:90:01")  # Soundbar reports STANDBY
+
+            # Power toggle sent, and the STANDBY it just reported is no longer trusted
+            assert mock.transmitted_commands == ["15:8F", "15:44:40", "15:45"]
+            assert cache.get(5) is None
+        assert len(bus._processors) == 0
+
+    def test_soundbar_processor_not_spawned_when_known_on(self, addresses):
+        """Test that SoundbarOnWithTvProcessor doesn't spawn while the soundbar is known to be ON"""
+        mock = MockCECComms()
+        bus = CECEventBus(mock)
+        bus.init()
+        cache = PowerStatusCache()
+        bus.add_callback(cache.observe)
+
+        with patch('time.monotonic', return_value=1000.0):
+            bus.add_processor(SoundbarOnWithTvProcessor(bus, addresses, cache))
+            mock.simulate_received_command("51:90:00")  # Soundbar reports ON
+
+        # TV answers a poll after the cache TTL but within the 30s the spawn guard trusts
+        with patch('time.monotonic', return_value=1010.0):
+            bus.tick()  # Initial poll timed out, poll again
+            mock.simulate_received_command("01:90:00")  # TV ON
+        assert mock.transmitted_commands == ["10:8F", "10:8F"]
+        assert len(bus._processors) == 1
+
+        # Once the report is too old, the soundbar is checked again
+        with patch('time.monotonic', return_value=1031.0):
+            bus.tick()  # Next poll due
+            mock.simulate_received_command("01:90:00")  # TV ON
+        assert mock.transmitted_commands[-1] == "15:8F"
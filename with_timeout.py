@@ -1,11 +1,17 @@
 import logging
 import time
 
+from eventbus import Sleep
+
 
 def with_timeout(seconds: float):
     """
     Decorator to add timeout handling to processor generators.
 
+    The wrapper adds a Sleep for the remaining time to everything the processor
+    yields, so the event bus resumes it when the timeout expires even if no frames
+    arrive. The wrapped processor may use Match and Sleep as normal.
+
     Args:
         seconds: Timeout in seconds
 
@@ -15,16 +21,15 @@ def with_timeout(seconds: float):
     Example:
         @with_timeout(5.0)
         def my_processor():
-            cmd = yield [CECCommand.build(destination=0, opcode=0x8F)]
-            while cmd.initiator != 0 or cmd.opcode != 0x90:
-                cmd = yield []
+            cmd = yield [CECCommand.build(destination=0, opcode=0x8F), Match(0, 0x90)]
             # Process response...
             yield [CECCommand.build(...), None]  # Terminate with None
     """
     def decorator(processor_func):
         def wrapper(*args, **kwargs):
             gen = processor_func(*args, **kwargs)  # Create the actual processor with arguments
-            start_time = time.time()
+            # Monotonic so wall-clock adjustments (NTP on boot) can't trigger or hide a timeout
+            deadline = time.monotonic() + seconds
             logger = logging.getLogger(f'Processor({processor_func.__name__})')
 
             try:
@@ -32,16 +37,23 @@ def with_timeout(seconds: float):
                 result = next(gen)
 
                 while True:
-                    # Check timeout before forwarding each event
-                    elapsed = time.time() - start_time
-                    if elapsed > seconds:
-                        logger.warning(f"Processor '{processor_func.__name__}' timed out after {elapsed:.2f}s")
+                    # Termination needs no timer, so pass it through untouched (no new list
+                    # for a shared terminating tuple)
+                    if result is None or None in result:
+                        yield result
+                        return
+
+                    # Act as proxy: receive event, forward to real processor
+                    event = yield [*result, Sleep(deadline - time.monotonic())]
+
+                    # Check timeout before forwarding each event. A None the processor
+                    # didn't ask for (no Sleep of its own) is our timer expiring
+                    if time.monotonic() >= deadline or (event is None and not any(cmd.__class__ is Sleep for cmd in result)):
+                        logger.warning(f"Processor '{processor_func.__name__}' timed out after {seconds:.2f}s")
                         gen.close()
                         yield [None]  # Signal termination to event bus
                         return
 
-                    # Act as proxy: receive event, forward to real processor
-                    event = yield result
                     result = gen.send(event)
 
             except StopIteration: